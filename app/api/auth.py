@@ -1,25 +1,42 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from app.core.database import get_session
-from app.core.security import verify_password, get_password_hash, create_access_token
+from starlette.concurrency import run_in_threadpool
+from sqlmodel import select, func, or_
+from sqlalchemy import bindparam
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_async_session
+from app.core.security import verify_password, get_password_hash, password_needs_rehash, create_access_token
 from app.models.user import User, UserRole
-from app.models.student_course import StudentCourse
-from app.schemas.auth import LoginRequest, TokenResponse, UserResponse, CreateUserRequest
-from app.utils.auth import get_current_user, get_current_admin
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from app.schemas.auth import LoginRequest, TokenResponse, UserResponse, CreateUserRequest, normalize_email
+from app.utils.auth import get_current_user_with_courses_async
+from pydantic import BaseModel, validator
+from typing import Optional, List, Tuple
 import secrets
-import string
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Login lookup built once and reused with bound parameters, so each request
+# skips statement construction and hits SQLAlchemy's compiled cache
+USER_BY_EMAIL = (
+    select(User)
+    .where(func.lower(User.email) == bindparam("email"))
+    # ix_user_email_lower is not unique: rows stored before emails were
+    # normalized may differ only in case, so prefer the exact-case match and
+    # then the oldest row to always resolve to the same account
+    .order_by((User.email == bindparam("raw_email")).desc(), User.created_at)
+)
+
+# Verified against when the email is unknown, so login timing does not reveal
+# which emails are registered
+DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(16))
+
 
 class ProfileCompletionRequest(BaseModel):
     """Request model for completing user profile"""
     name: str
     mobile: Optional[str] = None
     email: Optional[str] = None
+    
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
 
 
 class ProfileCompletionResponse(BaseModel):
@@ -30,16 +47,26 @@ class ProfileCompletionResponse(BaseModel):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(
+async def login(
     login_data: LoginRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Authenticate user and return JWT token"""
     # Find user by email
-    statement = select(User).where(User.email == login_data.email)
-    user = session.exec(statement).first()
+    user = (await session.exec(
+        USER_BY_EMAIL,
+        params={"email": normalize_email(login_data.email), "raw_email": login_data.email}
+    )).first()
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # Always run one bcrypt verify so unknown emails cost the same as wrong
+    # passwords; bcrypt is CPU-bound, so run it in FastAPI's bounded
+    # threadpool instead of on the event loop
+    hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    password_valid = await run_in_threadpool(
+        verify_password, login_data.password, hashed_password
+    )
+    
+    if not user or not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -52,6 +79,14 @@ def login(
             detail="Inactive user"
         )
     
+    # Lazily migrate hashes made at an old bcrypt cost while we have the password
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await run_in_threadpool(
+            get_password_hash, login_data.password
+        )
+        session.add(user)
+        await session.commit()
+    
     # Create access token
     access_token = create_access_token(data={"sub": user.id})
     
@@ -64,21 +99,14 @@ def login(
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+async def get_current_user_info(
+    user_with_courses: Tuple[User, List[str]] = Depends(get_current_user_with_courses_async)
 ):
     """Get current user information"""
-    # Get course IDs for students
-    course_ids = []
-    if current_user.role == UserRole.STUDENT:
-        student_courses = session.exec(
-            select(StudentCourse.course_id).where(
-                StudentCourse.student_id == current_user.id,
-                StudentCourse.is_active == True
-            )
-        ).all()
-        course_ids = list(student_courses)
+    # User and course IDs arrive from one query; only students have enrollments
+    current_user, course_ids = user_with_courses
+    if current_user.role != UserRole.STUDENT:
+        course_ids = []
     
     return UserResponse(
         id=current_user.id,
@@ -94,42 +122,42 @@ def get_current_user_info(
 
 
 @router.post("/create-admin", response_model=UserResponse)
-def create_admin_user(
+async def create_admin_user(
     user_data: CreateUserRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Create admin user (for initial setup)"""
-    # Check if admin already exists
-    statement = select(User).where(User.role == UserRole.ADMIN)
-    existing_admin = session.exec(statement).first()
+    # Check for an existing admin and a taken email in one round-trip
+    statement = select(
+        func.bool_or(User.role == UserRole.ADMIN),
+        func.bool_or(func.lower(User.email) == user_data.email)
+    ).where(or_(User.role == UserRole.ADMIN, func.lower(User.email) == user_data.email))
+    admin_exists, email_taken = (await session.exec(statement)).one()
     
-    if existing_admin:
+    if admin_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Admin user already exists"
         )
     
-    # Check if email already exists
-    statement = select(User).where(User.email == user_data.email)
-    existing_user = session.exec(statement).first()
-    
-    if existing_user:
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create admin user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
     user = User(
         email=user_data.email,
         hashed_password=hashed_password,
         role=UserRole.ADMIN
     )
     
+    # No refresh: every column is filled in Python before the INSERT and the
+    # session does not expire attributes on commit
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
     
     return UserResponse(
         id=user.id,
@@ -141,18 +169,29 @@ def create_admin_user(
 
 
 def generate_random_password(length: int = 8) -> str:
-    """Generate a random password"""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length)) 
+    """Generate a random alphanumeric password"""
+    # One CSPRNG draw per attempt instead of a secrets.choice() call per
+    # character; "-" and "_" are stripped to keep the [A-Za-z0-9] alphabet
+    password = ""
+    while len(password) < length:
+        token = secrets.token_urlsafe(length * 2)
+        password += token.replace("-", "").replace("_", "")
+    return password[:length]
 
 
 @router.post("/complete-profile", response_model=ProfileCompletionResponse)
-def complete_user_profile(
+async def complete_user_profile(
     profile_data: ProfileCompletionRequest,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    user_with_courses: Tuple[User, List[str]] = Depends(get_current_user_with_courses_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Complete user profile with name, mobile, and optionally email"""
+    # Course IDs come with the user from one query; completing a profile
+    # does not change enrollments
+    current_user, course_ids = user_with_courses
+    if current_user.role != UserRole.STUDENT:
+        course_ids = []
+    
     try:
         # Update user profile
         current_user.name = profile_data.name.strip()
@@ -164,12 +203,12 @@ def complete_user_profile(
         # Update email if provided (for students completing OTPLESS profile)
         if profile_data.email:
             # Check if email is already taken by another user
-            if profile_data.email != current_user.email:
-                statement = select(User).where(
-                    User.email == profile_data.email,
+            if profile_data.email != (current_user.email or "").lower():
+                statement = select(User.id).where(
+                    func.lower(User.email) == profile_data.email,
                     User.id != current_user.id
-                )
-                existing_user = session.exec(statement).first()
+                ).limit(1)
+                existing_user = (await session.exec(statement)).first()
                 
                 if existing_user:
                     raise HTTPException(
@@ -177,25 +216,12 @@ def complete_user_profile(
                         detail="Email already registered by another user"
                     )
             
-            current_user.email = profile_data.email.strip()
+            current_user.email = profile_data.email
         
         current_user.profile_completed = True
-        current_user.updated_at = datetime.utcnow()
         
         session.add(current_user)
-        session.commit()
-        session.refresh(current_user)
-        
-        # Get course IDs for students
-        course_ids = []
-        if current_user.role == UserRole.STUDENT:
-            student_courses = session.exec(
-                select(StudentCourse.course_id).where(
-                    StudentCourse.student_id == current_user.id,
-                    StudentCourse.is_active == True
-                )
-            ).all()
-            course_ids = list(student_courses)
+        await session.commit()
         
         return ProfileCompletionResponse(
             success=True,
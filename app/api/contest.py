@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select
-from typing import List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlmodel import Session, select, func
+from sqlalchemy import bindparam, exists, insert, literal_column
+from sqlalchemy.exc import IntegrityError
+from typing import Any, List, Optional, Dict, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-import json
+import hashlib
+import orjson
 
-from app.core.database import get_session, get_pool_status
-from app.core.cache import cache_contest_data, cache_user_data, invalidate_contest_cache
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_session, get_async_session, get_pool_status
+from app.core.cache import (
+    cache_contest_data, cache_user_data, invalidate_contest_cache, contest_cache,
+    contest_row_cache_key, CONTEST_ROW_TTL
+)
 from app.core.performance import monitor_performance, rate_limit, performance_monitor
 from app.models.contest import Contest, ContestProblem, ContestStatus
 from app.models.submission import Submission
@@ -17,26 +27,364 @@ from app.schemas.contest import (
     ContestCreate, ContestUpdate, ContestResponse, ContestDetailResponse,
     ContestProblemResponse, SubmissionCreate, SubmissionResponse, ContestStatusUpdate
 )
-from app.utils.auth import get_current_admin, get_current_user, get_current_student
-from app.utils.time_utils import utc_timestamp_ms, now_utc, to_utc, parse_iso_to_utc
+from app.utils.auth import (
+    get_current_admin, get_current_admin_async, get_current_user_async, get_current_student_async
+)
+from app.utils.time_utils import now_utc, to_utc, parse_iso_to_utc
 from app.utils.scoring import calculate_keyword_score, ScoringResult
-from app.models.mcq_problem import ScoringType
+from app.models.mcq_problem import ScoringType, VALID_MCQ_OPTIONS
+
+
+class ContestJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts non-string dict keys
+
+    Datetimes render exactly like isoformat() (e.g. '+00:00' for UTC), the
+    format contest endpoints have always returned to the frontend.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+router = APIRouter(prefix="/contests", tags=["Contests"], default_response_class=ContestJSONResponse)
+
+# Contest scheduling limits
+MIN_CONTEST_DURATION = timedelta(minutes=5)
+MAX_CONTEST_DURATION = timedelta(hours=24)
+PAST_START_TOLERANCE = timedelta(minutes=5)
+MIN_DURATION_DETAIL = f"Contest duration must be at least {MIN_CONTEST_DURATION.total_seconds() / 60} minutes"
+MAX_DURATION_DETAIL = f"Contest duration cannot exceed {MAX_CONTEST_DURATION.total_seconds() / 3600} hours"
+
+# Auto-submission is still accepted this long after a contest ends
+AUTO_SUBMIT_GRACE_PERIOD = timedelta(minutes=2)
+
+# Exclusion constraint from scripts/add_contest_overlap_constraint.py; catches
+# overlaps that race past the check in create_contest/update_contest
+CONTEST_OVERLAP_CONSTRAINT = "contest_no_overlap"
+CONTEST_OVERLAP_RACE_DETAIL = "Contest time overlaps with an existing contest in this course"
+
+# Range bounds inlined as a literal (not a bound parameter) so the overlap
+# probe's tstzrange matches the constraint's index expression
+CONTEST_WINDOW_BOUNDS = literal_column("'[)'")
+
+# Hot-path statements built once and reused with bound parameters, so each
+# request skips statement construction and hits SQLAlchemy's compiled cache
+CONTEST_WITH_ENROLLMENT = select(
+    Contest,
+    exists().where(
+        StudentCourse.student_id == bindparam("student_id"),
+        StudentCourse.course_id == Contest.course_id,
+        StudentCourse.is_active == True
+    )
+).where(Contest.id == bindparam("contest_id"))
+OWN_SUBMISSION_WITH_CONTEST = select(Submission, Contest).join(
+    Contest, Submission.contest_id == Contest.id
+).where(
+    Submission.contest_id == bindparam("contest_id"),
+    Submission.student_id == bindparam("student_id"),
+    exists().where(
+        StudentCourse.student_id == bindparam("student_id"),
+        StudentCourse.course_id == Contest.course_id,
+        StudentCourse.is_active == True
+    )
+)
+CONTEST_PROBLEMS = select(ContestProblem).where(
+    ContestProblem.contest_id == bindparam("contest_id")
+).order_by(ContestProblem.order_index)
+# Only the columns a submission review shows: skips sample answers and
+# keyword configurations, and returns plain rows instead of ORM entities
+REVIEW_PROBLEMS = select(
+    ContestProblem.id, ContestProblem.title, ContestProblem.description,
+    ContestProblem.option_a, ContestProblem.option_b, ContestProblem.option_c, ContestProblem.option_d,
+    ContestProblem.explanation, ContestProblem.image_url, ContestProblem.marks,
+    ContestProblem.order_index, ContestProblem.correct_options
+).where(
+    ContestProblem.contest_id == bindparam("contest_id")
+).order_by(ContestProblem.order_index)
+
+
+def contest_response_fields(contest, contest_status: ContestStatus) -> Dict:
+    """ContestResponse fields for a Contest entity or a row selecting its columns
+
+    Every endpoint that returns a contest builds it from this one mapping,
+    passed to model_construct() - the values come from the database, so
+    there is nothing to validate.
+    """
+    return {
+        "id": contest.id,
+        "course_id": contest.course_id,
+        "name": contest.name,
+        "description": contest.description,
+        "is_active": contest.is_active,
+        "start_time": contest.start_time,
+        "end_time": contest.end_time,
+        "status": contest_status,
+        "created_at": contest.created_at,
+        "timezone": "UTC",
+        "duration_seconds": int((contest.end_time - contest.start_time).total_seconds()),
+        "can_be_deleted": contest_status == ContestStatus.NOT_STARTED
+    }
+
+
+async def has_submission(session: AsyncSession, contest_id: str, student_id: Optional[str] = None) -> bool:
+    """Check whether a contest has submissions (optionally from one student) with EXISTS"""
+    conditions = [Submission.contest_id == contest_id]
+    if student_id is not None:
+        conditions.append(Submission.student_id == student_id)
+    return (await session.exec(select(exists().where(*conditions)))).one()
+
+
+async def get_cached_contest(session: AsyncSession, contest_id: str) -> Optional[Contest]:
+    """Get a contest row, served from a short-lived cache
+
+    Only for read paths with no access check of their own to combine it
+    with. Contest mutations must call invalidate_contest_cache(contest_id).
+    """
+    cache_key = contest_row_cache_key(contest_id)
+    contest = contest_cache.get(cache_key)
+    if contest is not None:
+        return contest
+    
+    contest = await session.get(Contest, contest_id)
+    if contest is not None:
+        contest_cache.set(cache_key, contest, ttl=CONTEST_ROW_TTL)
+    return contest
+
+
+async def get_contest_for_student(session: AsyncSession, contest_id: str, student_id: str) -> Contest:
+    """Load a contest and check the student's enrollment in a single query
+
+    The enrollment EXISTS is correlated with the contest's course and
+    selected alongside the row, instead of a second query after the contest
+    is loaded. (Statements on one AsyncSession cannot run concurrently, so
+    folding them into one query is how the round-trip is saved.)
+    """
+    row = (await session.exec(
+        CONTEST_WITH_ENROLLMENT, params={"contest_id": contest_id, "student_id": student_id}
+    )).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contest not found"
+        )
+    
+    contest, is_enrolled = row
+    if not is_enrolled:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not enrolled in this contest's course"
+        )
+    return contest
+
+
+def overlaps_contest_window(start_time: datetime, end_time: datetime):
+    """Filter for contests whose [start_time, end_time) window overlaps the given one
+
+    Spelled like the contest_no_overlap exclusion constraint, so the probe
+    can use its GiST index.
+    """
+    return func.tstzrange(Contest.start_time, Contest.end_time, CONTEST_WINDOW_BOUNDS).op("&&")(
+        func.tstzrange(start_time, end_time, CONTEST_WINDOW_BOUNDS)
+    )
+
+
+def violated_constraint(error: IntegrityError) -> Optional[str]:
+    """Name of the constraint behind an IntegrityError, if the driver reports one"""
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None)
+
 
-router = APIRouter(prefix="/contests", tags=["Contests"])
+async def save_submission(session: AsyncSession, submission: Submission) -> None:
+    """Insert a submission, relying on ux_submission_contest_student for duplicates
+
+    No SELECT beforehand: the unique index rejects a second submission for
+    the same contest and student, including two concurrent requests that
+    would both have passed a pre-check. No refresh afterwards either: every
+    column is set in Python and the session does not expire on commit.
+    """
+    session.add(submission)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if violated_constraint(e) != "ux_submission_contest_student":
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already submitted for this contest"
+        )
+
+
+async def get_own_submission(session: AsyncSession, contest_id: str, student_id: str) -> Tuple[Submission, Contest]:
+    """Load a student's submission and its contest, enforcing course enrollment
+
+    The happy path is a single round-trip: the enrollment check is an EXISTS
+    correlated with the contest's course. Only when nothing comes back do we
+    look again - one more query - to tell a missing contest (404) from a
+    missing enrollment (403) or a missing submission (404).
+    """
+    row = (await session.exec(
+        OWN_SUBMISSION_WITH_CONTEST, params={"contest_id": contest_id, "student_id": student_id}
+    )).first()
+    if row:
+        return row
+    
+    # Raises the 404/403 if the contest or the enrollment is what is missing
+    await get_contest_for_student(session, contest_id, student_id)
+    
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="No submission found for this contest"
+    )
+
+
+async def list_student_submissions(session: AsyncSession, student_id: str) -> List[SubmissionResponse]:
+    """A student's submissions in their actively enrolled courses, newest first
+
+    One round-trip: the enrollment lookup is a subquery, and only the
+    response columns are selected.
+    """
+    enrolled_courses = select(StudentCourse.course_id).where(
+        StudentCourse.student_id == student_id,
+        StudentCourse.is_active == True
+    )
+    rows = (await session.exec(
+        select(
+            Submission.id, Submission.contest_id, Submission.total_score,
+            Submission.max_possible_score, Submission.submitted_at,
+            Submission.time_taken_seconds, Submission.is_auto_submitted
+        ).join(Contest, Submission.contest_id == Contest.id).where(
+            Submission.student_id == student_id,
+            Contest.course_id.in_(enrolled_courses)
+        ).order_by(Submission.submitted_at.desc())
+    )).all()
+    
+    submission_responses = []
+    for row in rows:
+        percentage = (row.total_score / row.max_possible_score * 100) if row.max_possible_score > 0 else 0
+        submission_responses.append(SubmissionResponse.model_construct(
+            id=row.id,
+            contest_id=row.contest_id,
+            student_id=student_id,
+            total_score=row.total_score,
+            max_possible_score=row.max_possible_score,
+            submitted_at=row.submitted_at,
+            time_taken_seconds=row.time_taken_seconds,
+            is_auto_submitted=row.is_auto_submitted,
+            percentage=round(percentage, 2),
+            timezone="UTC"
+        ))
+    return submission_responses
+
+
+def score_auto_submission(problems: List[ContestProblem], answers: Dict) -> Tuple[float, float, Dict]:
+    """Score an auto-submission leniently: malformed or invalid answers count as unanswered
+
+    Returns (total_score, max_possible_score, problem_scores). Pure CPU work
+    with no session access, so it can run off the event loop.
+    """
+    total_score = 0.0
+    max_possible_score = 0.0
+    problem_scores = {}
+    
+    for problem in problems:
+        max_possible_score += problem.marks
+        
+        # Get student's answer for this problem (empty if not answered)
+        student_answer = answers.get(problem.id, [])
+        
+        # Handle different question types for auto-submission
+        if problem.question_type.value == "mcq":
+            # MCQ auto-scoring logic
+            try:
+                correct_options = problem.get_correct_options()
+                correct_set = problem.get_correct_option_set()
+            except (ValueError, TypeError):
+                correct_options = []
+                correct_set = frozenset()
+            
+            # Validate answer format (skip invalid answers for auto-submission)
+            if not isinstance(student_answer, list):
+                student_answer = []
+            
+            # Filter out invalid options
+            student_answer = [opt for opt in student_answer if opt in VALID_MCQ_OPTIONS]
+            
+            # Score using exact set matching
+            if frozenset(student_answer) == correct_set:
+                score = problem.marks
+                total_score += score
+            else:
+                score = 0.0
+                
+            correct_options_for_response = correct_options
+            
+        else:
+            # Long Answer auto-submission
+            correct_options_for_response = []
+            
+            # For Long Answer, student_answer should be a string
+            if not isinstance(student_answer, str):
+                student_answer = ""
+            
+            # Apply keyword scoring if configured
+            if problem.scoring_type == ScoringType.KEYWORD_BASED and problem.keywords_for_scoring:
+                try:
+                    scoring_result = calculate_keyword_score(
+                        student_answer, 
+                        problem.keywords_for_scoring, 
+                        problem.marks
+                    )
+                    score = scoring_result.score
+                    
+                    keyword_analysis = {
+                        "found_keywords": scoring_result.found_keywords,
+                        "missing_keywords": scoring_result.missing_keywords,
+                        "match_details": scoring_result.match_details,
+                        "auto_scored": True,
+                        "scoring_method": "keyword_based"
+                    }
+                    
+                except Exception as e:
+                    score = 0.0
+                    keyword_analysis = {
+                        "error": str(e),
+                        "auto_scored": False,
+                        "scoring_method": "manual_fallback"
+                    }
+            else:
+                score = 0.0
+                keyword_analysis = {
+                    "auto_scored": False,
+                    "scoring_method": "manual"
+                }
+        
+        problem_scores[problem.id] = {
+            "score": score,
+            "max_score": problem.marks,
+            "student_answer": student_answer,
+            "correct_answer": correct_options_for_response,
+            "keyword_analysis": keyword_analysis if problem.question_type.value == "long_answer" else None
+        }
+    
+    return total_score, max_possible_score, problem_scores
 
 
 @router.get("/time")
 @monitor_performance
-def get_server_time():
+async def get_server_time():
     """Get current server time in UTC for frontend synchronization"""
+    # async def: no I/O here, so skip the threadpool hop a sync endpoint takes
     current_utc = now_utc()
-    return {
-        "epoch_ms": utc_timestamp_ms(),
-        "iso": current_utc.isoformat(),
+    # Returned as a response directly: orjson renders the datetime itself,
+    # and jsonable_encoder never runs on this frequently polled endpoint
+    return ContestJSONResponse({
+        "epoch_ms": int(current_utc.timestamp() * 1000),
+        "iso": current_utc,
         "timezone": "UTC",
         "timestamp": current_utc.timestamp(),
         "formatted": current_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
-    }
+    })
 
 # 🚀 PERFORMANCE MONITORING ENDPOINTS
 @router.get("/health")
@@ -55,7 +403,7 @@ def get_api_health():
 
 @router.get("/performance")
 @monitor_performance
-def get_performance_metrics(current_admin: User = Depends(get_current_admin)):
+async def get_performance_metrics(current_admin: User = Depends(get_current_admin_async)):
     """Get detailed performance metrics (admin only)"""
     return {
         "performance": performance_monitor.get_performance_summary(),
@@ -65,13 +413,14 @@ def get_performance_metrics(current_admin: User = Depends(get_current_admin)):
 
 
 @router.get("/{contest_id}/time")
-def get_contest_time_info(
+async def get_contest_time_info(
     contest_id: str,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: User = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get server time with contest-specific timing information"""
-    contest = session.get(Contest, contest_id)
+    # Polled by every client during a contest, so the row comes from the cache
+    contest = await get_cached_contest(session, contest_id)
     if not contest:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,7 +429,7 @@ def get_contest_time_info(
     
     # Basic access control (detailed check done in other endpoints)
     current_utc = now_utc()
-    contest_status = contest.get_status()
+    contest_status = contest.get_status(current_utc)
     
     # Calculate time relationships
     time_to_start = None
@@ -95,18 +444,18 @@ def get_contest_time_info(
         if contest_status == ContestStatus.IN_PROGRESS:
             time_remaining = time_to_end
     
-    return {
+    return ContestJSONResponse({
         "server_time": {
-            "epoch_ms": utc_timestamp_ms(),
-            "iso": current_utc.isoformat(),
+            "epoch_ms": int(current_utc.timestamp() * 1000),
+            "iso": current_utc,
             "timezone": "UTC"
         },
         "contest": {
             "id": contest.id,
             "name": contest.name,
             "status": contest_status.value,
-            "start_time": contest.start_time.isoformat(),
-            "end_time": contest.end_time.isoformat(),
+            "start_time": contest.start_time,
+            "end_time": contest.end_time,
             "duration_seconds": int((contest.end_time - contest.start_time).total_seconds())
         },
         "timing": {
@@ -116,19 +465,19 @@ def get_contest_time_info(
             "is_accessible": contest_status != ContestStatus.NOT_STARTED,
             "can_submit": contest_status == ContestStatus.IN_PROGRESS
         }
-    }
+    })
 
 
 @router.post("/", response_model=ContestResponse)
-def create_contest(
+async def create_contest(
     contest_data: ContestCreate,
     course_id: str = Query(..., description="Course ID for the contest"),
-    current_admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    current_admin: User = Depends(get_current_admin_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Create a new contest with timezone-aware validation"""
     # Verify course exists and admin owns it
-    course = session.get(Course, course_id)
+    course = await session.get(Course, course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,15 +490,9 @@ def create_contest(
             detail="You can only create contests for your own courses"
         )
     
-    # Ensure datetime inputs are timezone-aware (convert if naive)
-    start_time = to_utc(contest_data.start_time) if contest_data.start_time.tzinfo is None else contest_data.start_time
-    end_time = to_utc(contest_data.end_time) if contest_data.end_time.tzinfo is None else contest_data.end_time
-    
-    # Convert to UTC if not already
-    if start_time.tzinfo != timezone.utc:
-        start_time = start_time.astimezone(timezone.utc)
-    if end_time.tzinfo != timezone.utc:
-        end_time = end_time.astimezone(timezone.utc)
+    # Ensure datetime inputs are timezone-aware UTC (naive input is assumed UTC)
+    start_time = to_utc(contest_data.start_time)
+    end_time = to_utc(contest_data.end_time)
     
     current_time = now_utc()
     
@@ -161,39 +504,35 @@ def create_contest(
         )
     
     # Check minimum contest duration (e.g., 5 minutes)
-    min_duration = timedelta(minutes=5)
-    if (end_time - start_time) < min_duration:
+    if (end_time - start_time) < MIN_CONTEST_DURATION:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Contest duration must be at least {min_duration.total_seconds() / 60} minutes"
+            detail=MIN_DURATION_DETAIL
         )
     
     # Check maximum contest duration (e.g., 24 hours)
-    max_duration = timedelta(hours=24)
-    if (end_time - start_time) > max_duration:
+    if (end_time - start_time) > MAX_CONTEST_DURATION:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Contest duration cannot exceed {max_duration.total_seconds() / 3600} hours"
+            detail=MAX_DURATION_DETAIL
         )
     
     # Optionally prevent scheduling contests too far in the past
-    if start_time < (current_time - timedelta(minutes=5)):
+    if start_time < (current_time - PAST_START_TOLERANCE):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot create contests that start more than 5 minutes in the past"
         )
     
     # Check for overlapping contests in the same course
-    overlapping_contests = session.exec(
-        select(Contest).where(
+    conflict_names = (await session.exec(
+        select(Contest.name).where(
             Contest.course_id == course_id,
-            Contest.start_time < end_time,
-            Contest.end_time > start_time
+            overlaps_contest_window(start_time, end_time)
         )
-    ).all()
+    )).all()
     
-    if overlapping_contests:
-        conflict_names = [c.name for c in overlapping_contests]
+    if conflict_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Contest time overlaps with existing contests: {', '.join(conflict_names)}"
@@ -206,6 +545,23 @@ def create_contest(
             detail="Contest must have at least one problem"
         )
     
+    # 🚀 Fetch every referenced MCQ in one IN query instead of one get() per problem
+    problem_ids = [problem_data.problem_id for problem_data in contest_data.problems]
+    mcq_problems_by_id = {
+        mcq_problem.id: mcq_problem
+        for mcq_problem in (await session.exec(
+            select(MCQProblem).where(MCQProblem.id.in_(problem_ids))
+        )).all()
+    }
+    
+    # Reject unknown problems before anything is written
+    missing_ids = set(problem_ids) - mcq_problems_by_id.keys()
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"MCQ problem(s) not found: {', '.join(sorted(missing_ids))}"
+        )
+    
     # Create contest with validated times
     contest = Contest(
         course_id=course_id,
@@ -216,17 +572,22 @@ def create_contest(
     )
     
     session.add(contest)
-    session.flush()  # Get contest ID
+    try:
+        await session.flush()  # Get contest ID
+    except IntegrityError as e:
+        await session.rollback()
+        if violated_constraint(e) != CONTEST_OVERLAP_CONSTRAINT:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=CONTEST_OVERLAP_RACE_DETAIL
+        )
     
     # Add problems to contest (deep copy from MCQ bank)
     total_marks = 0.0
+    contest_problems = []
     for idx, problem_data in enumerate(contest_data.problems):
-        mcq_problem = session.get(MCQProblem, problem_data.problem_id)
-        if not mcq_problem:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"MCQ problem {problem_data.problem_id} not found"
-            )
+        mcq_problem = mcq_problems_by_id[problem_data.problem_id]
         
         # Validate that question has tags assigned (cannot use untagged questions in contests)
         if mcq_problem.needs_tags:
@@ -266,7 +627,7 @@ def create_contest(
             order_index=idx
         )
         
-        session.add(contest_problem)
+        contest_problems.append(contest_problem.model_dump())
     
     # Validate total marks
     if total_marks <= 0:
@@ -275,162 +636,114 @@ def create_contest(
             detail="Contest must have at least some marks assigned"
         )
     
-    session.commit()
-    session.refresh(contest)
-    
-    return ContestResponse(
-        id=contest.id,
-        course_id=contest.course_id,
-        name=contest.name,
-        description=contest.description,
-        is_active=contest.is_active,
-        start_time=contest.start_time,
-        end_time=contest.end_time,
-        status=contest.get_status(),
-        created_at=contest.created_at,
-        timezone="UTC",
-        duration_seconds=int((contest.end_time - contest.start_time).total_seconds())
-    )
+    # 🚀 ORM bulk INSERT: one executemany for all problems, and the copies are
+    # never tracked in the identity map since nothing reads them back here
+    await session.exec(insert(ContestProblem), params=contest_problems)
+    await session.commit()
+    
+    return ContestResponse.model_construct(**contest_response_fields(contest, contest.get_status(current_time)))
 
 
 @router.get("/my-submissions", response_model=List[SubmissionResponse])
-def get_my_all_submissions(
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+async def get_my_all_submissions(
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get all submissions for the current student across all contests they have access to"""
-    # Get all course IDs the student is enrolled in
-    enrolled_courses = session.exec(
-        select(StudentCourse.course_id).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.is_active == True
-        )
-    ).all()
-    
-    if not enrolled_courses:
-        return []
-    
-    # Get all submissions for this student across their enrolled courses
-    submissions = session.exec(
-        select(Submission, Contest).join(Contest).where(
-            Submission.student_id == current_student.id,
-            Contest.course_id.in_(enrolled_courses)
-        )
-    ).all()
-    
-    submission_responses = []
-    for submission, contest in submissions:
-        # Calculate percentage for response
-        percentage = (submission.total_score / submission.max_possible_score * 100) if submission.max_possible_score > 0 else 0
-        
-        submission_responses.append(SubmissionResponse(
-            id=submission.id,
-            contest_id=submission.contest_id,
-            student_id=submission.student_id,
-            total_score=submission.total_score,
-            max_possible_score=submission.max_possible_score,
-            submitted_at=submission.submitted_at,
-            time_taken_seconds=submission.time_taken_seconds,
-            is_auto_submitted=submission.is_auto_submitted,
-            percentage=round(percentage, 2),
-            timezone="UTC"
-        ))
-    
-    return submission_responses
+    return await list_student_submissions(session, current_student.id)
 
 
-@router.get("/", response_model=List[ContestResponse])
+@router.get("/", response_model=None, responses={200: {"model": List[ContestResponse]}})
 @monitor_performance
 @cache_contest_data(ttl=120)  # Cache for 2 minutes - contests don't change frequently
 @rate_limit(requests_per_minute=100)  # Higher limit for list endpoints
-def list_contests(
+async def list_contests(
     course_id: Optional[str] = Query(None, description="Filter by course ID"),
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: User = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """List contests (filtered by user role and course access) - OPTIMIZED"""
-    statement = select(Contest)
+    # 🚀 Select only the columns the response needs: plain row tuples, no
+    # ORM entities to hydrate or track in the identity map
+    list_columns = (
+        Contest.id, Contest.course_id, Contest.name, Contest.description,
+        Contest.is_active, Contest.start_time, Contest.end_time, Contest.created_at
+    )
+    statement = select(*list_columns)
     
     if current_user.role == UserRole.STUDENT:
-        # 🚀 OPTIMIZED: Use cached enrollment lookup
-        student_courses = session.exec(
-            select(StudentCourse.course_id).where(
-                StudentCourse.student_id == current_user.id,
-                StudentCourse.is_active == True
-            )
-        ).all()
-        
-        if not student_courses:
-            return []
+        # 🚀 OPTIMIZED: Enrollment lookup as a subquery - the course ids stay
+        # in the database and the list is a single round-trip
+        student_courses = select(StudentCourse.course_id).where(
+            StudentCourse.student_id == current_user.id,
+            StudentCourse.is_active == True
+        )
         
         # 🔥 OPTIMIZED: Use index-friendly query with explicit ordering
-        statement = select(Contest).where(
+        statement = select(*list_columns).where(
             Contest.course_id.in_(student_courses),
             Contest.is_active == True  # Partial index optimization
         ).order_by(Contest.start_time.desc())
         
-    elif course_id:
-        # Admin can filter by course_id
-        statement = statement.where(Contest.course_id == course_id)
-        statement = statement.order_by(Contest.start_time.desc())
     else:
+        # 🚀 OPTIMIZED: Admins only see contests of their own courses - filter
+        # in the database with a join instead of post-filtering every contest
+        statement = statement.join(Course, Contest.course_id == Course.id).where(
+            Course.instructor_id == current_user.id
+        )
+        if course_id:
+            # Admin can filter by course_id
+            statement = statement.where(Contest.course_id == course_id)
         statement = statement.order_by(Contest.start_time.desc())
     
-    contests = session.exec(statement).all()
-    
-    # Filter contests admin can access (only their courses)
-    if current_user.role == UserRole.ADMIN:
-        # 🚀 OPTIMIZED: Use cached admin course lookup
-        admin_courses = session.exec(
-            select(Course.id).where(Course.instructor_id == current_user.id)
-        ).all()
-        contests = [c for c in contests if c.course_id in admin_courses]
-    
-    return [
-        ContestResponse(
-            id=contest.id,
-            course_id=contest.course_id,
-            name=contest.name,
-            description=contest.description,
-            is_active=contest.is_active,
-            start_time=contest.start_time,
-            end_time=contest.end_time,
-            status=contest.get_status(),
-            created_at=contest.created_at,
-            timezone="UTC",
-            duration_seconds=int((contest.end_time - contest.start_time).total_seconds()),
-            can_be_deleted=contest.can_be_deleted()
-        )
-        for contest in contests
+    contests = (await session.exec(statement)).all()
+    
+    # One clock reading for the whole list instead of one per contest
+    current_utc = now_utc()
+    
+    # 🚀 Serialize with orjson directly - skips jsonable_encoder; the route
+    # has no response_model, so FastAPI builds no response field for it and
+    # the schema is documented through `responses` instead. The field dicts
+    # are already the ContestResponse shape, so no model is built per row
+    contest_responses = [
+        contest_response_fields(row, Contest.status_between(row.start_time, row.end_time, current_utc))
+        for row in contests
     ]
+    return ContestJSONResponse(contest_responses)
 
 
-@router.get("/{contest_id}", response_model=ContestDetailResponse)
-def get_contest(
+@router.get("/{contest_id}", response_model=None, responses={200: {"model": ContestDetailResponse}})
+async def get_contest(
     contest_id: str,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: User = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get contest details with problems"""
-    contest = session.get(Contest, contest_id)
-    if not contest:
+    # 🚀 Load the contest together with the access check in one round-trip:
+    # enrollment EXISTS for students, the course's instructor for admins
+    if current_user.role == UserRole.STUDENT:
+        access_column = exists().where(
+            StudentCourse.student_id == current_user.id,
+            StudentCourse.course_id == Contest.course_id,
+            StudentCourse.is_active == True
+        )
+        statement = select(Contest, access_column)
+    else:
+        statement = select(Contest, Course.instructor_id).outerjoin(
+            Course, Contest.course_id == Course.id
+        )
+    row = (await session.exec(statement.where(Contest.id == contest_id))).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contest not found"
         )
+    contest, access = row
     
     # Check access permissions
     if current_user.role == UserRole.STUDENT:
         # Check if student is enrolled in the contest's course
-        enrollment = session.exec(
-            select(StudentCourse).where(
-                StudentCourse.student_id == current_user.id,
-                StudentCourse.course_id == contest.course_id,
-                StudentCourse.is_active == True
-            )
-        ).first()
-        
-        if not enrollment:
+        if not access:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access denied to this contest"
@@ -445,21 +758,18 @@ def get_contest(
             
     elif current_user.role == UserRole.ADMIN:
         # Check if admin owns the course
-        course = session.get(Course, contest.course_id)
-        if not course or course.instructor_id != current_user.id:
+        if access != current_user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access denied to this contest"
             )
     
     # Get contest problems
-    statement = select(ContestProblem).where(
-        ContestProblem.contest_id == contest_id
-    ).order_by(ContestProblem.order_index)
-    problems = session.exec(statement).all()
+    problems = (await session.exec(CONTEST_PROBLEMS, params={"contest_id": contest_id})).all()
     
     # For students, hide correct answers if contest is active
-    contest_status = contest.get_status()
+    current_utc = now_utc()
+    contest_status = contest.get_status(current_utc)
     show_answers = (
         current_user.role == UserRole.ADMIN or 
         contest_status == ContestStatus.ENDED
@@ -469,16 +779,13 @@ def get_contest(
     for problem in problems:
         # Parse correct options for UI to determine single vs multiple choice
         # Handle None values for Long Answer questions
-        if problem.correct_options is not None:
-            try:
-                correct_options = json.loads(problem.correct_options)
-            except (json.JSONDecodeError, TypeError):
-                correct_options = []
-        else:
-            # Long Answer questions don't have correct_options
+        # Long Answer questions don't have correct_options
+        try:
+            correct_options = problem.get_correct_options()
+        except (ValueError, TypeError):
             correct_options = []
         
-        problem_response = ContestProblemResponse(
+        problem_response = ContestProblemResponse.model_construct(
             id=problem.id,
             question_type=problem.question_type.value,
             title=problem.title,
@@ -497,7 +804,6 @@ def get_contest(
         problem_responses.append(problem_response)
     
     # Calculate timing information for frontend
-    current_utc = now_utc()
     time_to_start = None
     time_to_end = None
     time_remaining = None
@@ -511,7 +817,7 @@ def get_contest(
             time_remaining = time_to_end
     
     time_info = {
-        "current_server_time": current_utc.isoformat(),
+        "current_server_time": current_utc,
         "time_to_start_seconds": time_to_start,
         "time_to_end_seconds": time_to_end,
         "time_remaining_seconds": time_remaining,
@@ -519,33 +825,22 @@ def get_contest(
         "is_accessible": contest_status != ContestStatus.NOT_STARTED and contest.is_active
     }
     
-    return ContestDetailResponse(
-        id=contest.id,
-        course_id=contest.course_id,
-        name=contest.name,
-        description=contest.description,
-        is_active=contest.is_active,
-        start_time=contest.start_time,
-        end_time=contest.end_time,
-        status=contest_status,
-        created_at=contest.created_at,
-        timezone="UTC",
-        duration_seconds=int((contest.end_time - contest.start_time).total_seconds()),
-        can_be_deleted=contest.can_be_deleted(),
+    return ContestJSONResponse(ContestDetailResponse.model_construct(
+        **contest_response_fields(contest, contest_status),
         problems=problem_responses,
         time_info=time_info
-    )
+    ).model_dump())
 
 
 @router.put("/{contest_id}", response_model=ContestResponse)
-def update_contest(
+async def update_contest(
     contest_id: str,
     contest_data: ContestUpdate,
-    current_admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    current_admin: User = Depends(get_current_admin_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Update contest details with timezone-aware validation"""
-    contest = session.get(Contest, contest_id)
+    contest = await session.get(Contest, contest_id)
     if not contest:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -553,7 +848,7 @@ def update_contest(
         )
     
     # Check if admin owns the course
-    course = session.get(Course, contest.course_id)
+    course = await session.get(Course, contest.course_id)
     if not course or course.instructor_id != current_admin.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -561,13 +856,11 @@ def update_contest(
         )
     
     # Get contest status to determine what can be updated
-    contest_status = contest.get_status()
     current_time = now_utc()
+    contest_status = contest.get_status(current_time)
     
     # Check if there are any submissions for this contest
-    existing_submissions = session.exec(
-        select(Submission).where(Submission.contest_id == contest_id)
-    ).first()
+    existing_submissions = await has_submission(session, contest_id)
     
     # Update basic info (always allowed unless contest has ended and has submissions)
     if contest_data.name is not None:
@@ -596,17 +889,11 @@ def update_contest(
         
         if contest_data.start_time is not None:
             # Ensure timezone-aware and convert to UTC
-            start_time = to_utc(contest_data.start_time) if contest_data.start_time.tzinfo is None else contest_data.start_time
-            if start_time.tzinfo != timezone.utc:
-                start_time = start_time.astimezone(timezone.utc)
-            new_start = start_time
+            new_start = to_utc(contest_data.start_time)
             
         if contest_data.end_time is not None:
             # Ensure timezone-aware and convert to UTC
-            end_time = to_utc(contest_data.end_time) if contest_data.end_time.tzinfo is None else contest_data.end_time
-            if end_time.tzinfo != timezone.utc:
-                end_time = end_time.astimezone(timezone.utc)
-            new_end = end_time
+            new_end = to_utc(contest_data.end_time)
         
         # Enhanced time validation
         if new_start >= new_end:
@@ -616,40 +903,36 @@ def update_contest(
             )
         
         # Check minimum contest duration (5 minutes)
-        min_duration = timedelta(minutes=5)
-        if (new_end - new_start) < min_duration:
+        if (new_end - new_start) < MIN_CONTEST_DURATION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Contest duration must be at least {min_duration.total_seconds() / 60} minutes"
+                detail=MIN_DURATION_DETAIL
             )
         
         # Check maximum contest duration (24 hours)
-        max_duration = timedelta(hours=24)
-        if (new_end - new_start) > max_duration:
+        if (new_end - new_start) > MAX_CONTEST_DURATION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Contest duration cannot exceed {max_duration.total_seconds() / 3600} hours"
+                detail=MAX_DURATION_DETAIL
             )
         
         # Prevent scheduling contests too far in the past
-        if new_start < (current_time - timedelta(minutes=5)):
+        if new_start < (current_time - PAST_START_TOLERANCE):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot schedule contests to start more than 5 minutes in the past"
             )
         
         # Check for overlapping contests in the same course (excluding current contest)
-        overlapping_contests = session.exec(
-            select(Contest).where(
+        conflict_names = (await session.exec(
+            select(Contest.name).where(
                 Contest.course_id == contest.course_id,
                 Contest.id != contest_id,  # Exclude current contest
-                Contest.start_time < new_end,
-                Contest.end_time > new_start
+                overlaps_contest_window(new_start, new_end)
             )
-        ).all()
+        )).all()
         
-        if overlapping_contests:
-            conflict_names = [c.name for c in overlapping_contests]
+        if conflict_names:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Contest time overlaps with existing contests: {', '.join(conflict_names)}"
@@ -660,62 +943,40 @@ def update_contest(
         contest.end_time = new_end
     
     # Update timestamp
-    contest.updated_at = now_utc()
+    contest.updated_at = current_time
     
     session.add(contest)
-    session.commit()
-    session.refresh(contest)
-    
-    return ContestResponse(
-        id=contest.id,
-        course_id=contest.course_id,
-        name=contest.name,
-        description=contest.description,
-        is_active=contest.is_active,
-        start_time=contest.start_time,
-        end_time=contest.end_time,
-        status=contest.get_status(),
-        created_at=contest.created_at,
-        timezone="UTC",
-        duration_seconds=int((contest.end_time - contest.start_time).total_seconds())
-    )
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if violated_constraint(e) != CONTEST_OVERLAP_CONSTRAINT:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=CONTEST_OVERLAP_RACE_DETAIL
+        )
+    invalidate_contest_cache(contest_id)
+    
+    return ContestResponse.model_construct(**contest_response_fields(contest, contest.get_status(current_time)))
 
 
 @router.post("/{contest_id}/submit", response_model=SubmissionResponse)
 @monitor_performance
 @rate_limit(requests_per_minute=30)  # Lower limit for submissions to prevent spam
-def submit_contest(
+async def submit_contest(
     contest_id: str,
     submission_data: SubmissionCreate,
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Submit answers for a contest with precise timezone validation - OPTIMIZED"""
-    contest = session.get(Contest, contest_id)
-    if not contest:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contest not found"
-        )
-    
-    # Check if student is enrolled in the contest's course
-    enrollment = session.exec(
-        select(StudentCourse).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.course_id == contest.course_id,
-            StudentCourse.is_active == True
-        )
-    ).first()
-    
-    if not enrollment:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not enrolled in this contest's course"
-        )
+    # Contest and enrollment check in one round-trip
+    contest = await get_contest_for_student(session, contest_id, current_student.id)
     
     # Precise timezone-aware contest timing validation
     current_utc = now_utc()
-    contest_status = contest.get_status()
+    contest_status = contest.get_status(current_utc)
     
     # More detailed timing checks
     if contest_status == ContestStatus.NOT_STARTED:
@@ -743,23 +1004,8 @@ def submit_contest(
             detail="Submission time is outside contest window. Please check your system clock."
         )
     
-    # Check if student already submitted
-    existing_submission = session.exec(
-        select(Submission).where(
-            Submission.contest_id == contest_id,
-            Submission.student_id == current_student.id
-        )
-    ).first()
-    
-    if existing_submission:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already submitted for this contest"
-        )
-    
     # Get contest problems for scoring
-    statement = select(ContestProblem).where(ContestProblem.contest_id == contest_id)
-    problems = session.exec(statement).all()
+    problems = (await session.exec(CONTEST_PROBLEMS, params={"contest_id": contest_id})).all()
     
     if not problems:
         raise HTTPException(
@@ -808,8 +1054,9 @@ def submit_contest(
         if problem.question_type.value == "mcq":
             # MCQ scoring logic
             try:
-                correct_options = json.loads(problem.correct_options) if problem.correct_options else []
-            except (json.JSONDecodeError, TypeError):
+                correct_options = problem.get_correct_options()
+                correct_set = problem.get_correct_option_set()
+            except (ValueError, TypeError):
                 # Handle malformed JSON in correct_options
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -824,8 +1071,8 @@ def submit_contest(
                 )
             
             # Validate answer options are valid (A, B, C, D)
-            valid_options = {"A", "B", "C", "D"}
-            invalid_options = set(student_answer) - valid_options
+            answer_set = frozenset(student_answer)
+            invalid_options = answer_set - VALID_MCQ_OPTIONS
             if invalid_options:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -833,7 +1080,7 @@ def submit_contest(
                 )
             
             # Score using exact set matching for MCQ
-            if set(student_answer) == set(correct_options):
+            if answer_set == correct_set:
                 score = problem.marks
                 total_score += score
             else:
@@ -908,23 +1155,21 @@ def submit_contest(
     submission = Submission(
         contest_id=contest_id,
         student_id=current_student.id,
-        answers=json.dumps(submission_data.answers),
+        answers=orjson.dumps(submission_data.answers).decode(),
         total_score=total_score,
         max_possible_score=max_possible_score,
         time_taken_seconds=submission_data.time_taken_seconds,
-        problem_scores=json.dumps(problem_scores),
+        problem_scores=orjson.dumps(problem_scores).decode(),
         is_auto_submitted=False
         # submitted_at will be automatically set by the model default
     )
     
-    session.add(submission)
-    session.commit()
-    session.refresh(submission)
+    await save_submission(session, submission)
     
     # Calculate percentage for response
     percentage = (submission.total_score / submission.max_possible_score * 100) if submission.max_possible_score > 0 else 0
     
-    return SubmissionResponse(
+    return SubmissionResponse.model_construct(
         id=submission.id,
         contest_id=submission.contest_id,
         student_id=submission.student_id,
@@ -939,13 +1184,15 @@ def submit_contest(
 
 
 @router.get("/{contest_id}/submissions")
-def get_contest_submissions(
+async def get_contest_submissions(
     contest_id: str,
-    current_admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all submissions if omitted)"),
+    offset: int = Query(0, ge=0, description="Number of submissions to skip"),
+    current_admin: User = Depends(get_current_admin_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
-    """Get all submissions for a contest (admin only)"""
-    contest = session.get(Contest, contest_id)
+    """Get submissions for a contest (admin only), optionally one page at a time"""
+    contest = await session.get(Contest, contest_id)
     if not contest:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -953,41 +1200,58 @@ def get_contest_submissions(
         )
     
     # Check if admin owns the course
-    course = session.get(Course, contest.course_id)
+    course = await session.get(Course, contest.course_id)
     if not course or course.instructor_id != current_admin.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied to this contest"
         )
     
-    # Get submissions with student info
-    statement = select(Submission, User).join(
+    # Get submissions with student info in one joined query, selecting only the
+    # listed columns - skips the large answers/problem_scores JSON and ORM
+    # object hydration for every row. Columns are labelled with the response
+    # keys and the percentage is computed by Postgres, so each row maps
+    # straight to a response dict
+    statement = select(
+        Submission.id.label("id"),
+        User.email.label("student_email"),
+        User.name.label("student_name"),
+        User.id.label("student_id"),
+        Submission.total_score.label("total_score"),
+        Submission.max_possible_score.label("max_possible_score"),
+        func.coalesce(
+            Submission.total_score * 100.0 / func.nullif(Submission.max_possible_score, 0), 0
+        ).label("percentage"),
+        Submission.submitted_at.label("submitted_at"),
+        Submission.time_taken_seconds.label("time_taken_seconds"),
+        Submission.is_auto_submitted.label("is_auto_submitted")
+    ).join(
         User, Submission.student_id == User.id
-    ).where(Submission.contest_id == contest_id)
-    
-    results = session.exec(statement).all()
-    
-    submissions = []
-    for submission, student in results:
-        submissions.append({
-            "id": submission.id,
-            "student_email": student.email,
-            "student_name": student.name,
-            "student_id": student.id,
-            "total_score": submission.total_score,
-            "max_possible_score": submission.max_possible_score,
-            "percentage": (submission.total_score / submission.max_possible_score * 100) if submission.max_possible_score > 0 else 0,
-            "submitted_at": submission.submitted_at,
-            "time_taken_seconds": submission.time_taken_seconds,
-            "is_auto_submitted": submission.is_auto_submitted
-        })
+    ).where(
+        Submission.contest_id == contest_id
+    ).order_by(Submission.submitted_at, Submission.id)
+    
+    # Bound the rows (and response size) pulled for large contests
+    paginated = limit is not None or offset > 0
+    if paginated:
+        statement = statement.offset(offset).limit(limit)
+    
+    submissions = [dict(row) for row in (await session.exec(statement)).mappings()]
+    
+    # A page needs a separate count; an unpaginated list is its own total
+    if paginated:
+        total_submissions = (await session.exec(
+            select(func.count()).select_from(Submission).where(Submission.contest_id == contest_id)
+        )).one()
+    else:
+        total_submissions = len(submissions)
     
-    return {
+    return ContestJSONResponse({
         "contest_id": contest_id,
         "contest_name": contest.name,
-        "total_submissions": len(submissions),
+        "total_submissions": total_submissions,
         "submissions": submissions
-    }
+    })
 
 # 🚀 BULK OPERATIONS ENDPOINTS (High Performance)
 
@@ -1027,6 +1291,10 @@ def bulk_validate_students(
     enrollment_status = bulk_ops.bulk_validate_students(student_ids, contest.course_id)
     submission_status = bulk_ops.bulk_check_existing_submissions(contest_id, student_ids)
     
+    # Contest status is the same for every student - compute it once
+    contest_status = contest.get_status()
+    contest_in_progress = contest_status == ContestStatus.IN_PROGRESS
+    
     results = []
     for student_id in student_ids:
         results.append({
@@ -1036,7 +1304,7 @@ def bulk_validate_students(
             "can_submit": (
                 enrollment_status.get(student_id, False) and 
                 not submission_status.get(student_id, False) and
-                contest.get_status() == ContestStatus.IN_PROGRESS
+                contest_in_progress
             )
         })
     
@@ -1045,7 +1313,7 @@ def bulk_validate_students(
         "validation_results": results,
         "total_students": len(student_ids),
         "eligible_students": sum(1 for r in results if r["can_submit"]),
-        "contest_status": contest.get_status().value
+        "contest_status": contest_status.value
     }
 
 @router.get("/bulk-stats")
@@ -1078,77 +1346,39 @@ def bulk_get_contest_stats(
     bulk_ops = BulkOperations(session)
     stats = bulk_ops.bulk_get_contest_stats(accessible_contest_ids)
     
-    # Enrich with contest names
+    # Enrich with contest names and statuses - one dict lookup per contest
+    # instead of rescanning the contest list, all against one clock reading
+    current_utc = now_utc()
     contest_map = {contest.id: contest.name for contest, course in contests}
+    status_map = {contest.id: contest.get_status(current_utc).value for contest, course in contests}
     
     enriched_stats = {}
     for contest_id, stat_data in stats.items():
         enriched_stats[contest_id] = {
             **stat_data,
             "contest_name": contest_map.get(contest_id, "Unknown"),
-            "contest_status": next(
-                (contest.get_status().value for contest, course in contests if contest.id == contest_id),
-                "unknown"
-            )
+            "contest_status": status_map.get(contest_id, "unknown")
         }
     
     return {
         "stats": enriched_stats,
         "total_contests": len(accessible_contest_ids),
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": current_utc.isoformat()
     }
 
 @router.get("/my-submissions-bulk", response_model=List[SubmissionResponse])
 @monitor_performance
 @cache_user_data(ttl=60)  # Cache student submissions for 1 minute
 @rate_limit(requests_per_minute=50)
-def get_my_submissions_bulk(
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+async def get_my_submissions_bulk(
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """
     Get all submissions for current student across all courses - OPTIMIZED
-    Uses bulk operations for better performance
+    Async, and one query for every enrolled course
     """
-    from app.core.bulk_operations import BulkOperations
-    
-    # Get enrolled courses
-    enrolled_courses = session.exec(
-        select(StudentCourse.course_id).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.is_active == True
-        )
-    ).all()
-    
-    if not enrolled_courses:
-        return []
-    
-    bulk_ops = BulkOperations(session)
-    
-    # Use bulk operation to get submissions efficiently
-    student_submissions_map = bulk_ops.bulk_get_student_submissions(
-        [current_student.id], 
-        enrolled_courses[0] if len(enrolled_courses) == 1 else None
-    )
-    
-    submissions = student_submissions_map.get(current_student.id, [])
-    
-    # Convert to response format
-    return [
-        SubmissionResponse(
-            id=sub["id"],
-            contest_id=sub["contest_id"],
-            student_id=current_student.id,
-            total_score=sub["total_score"],
-            max_possible_score=sub["max_possible_score"],
-            submitted_at=sub["submitted_at"],
-            time_taken_seconds=sub["time_taken_seconds"],
-            is_auto_submitted=sub["is_auto_submitted"],
-            percentage=sub["percentage"],
-            timezone="UTC"
-        )
-        for sub in submissions
-    ]
+    return await list_student_submissions(session, current_student.id)
 
 # 🎯 PERFORMANCE OPTIMIZATION ENDPOINTS
 
@@ -1211,52 +1441,19 @@ def warm_contest_cache(
 
 
 @router.get("/{contest_id}/my-submission", response_model=SubmissionResponse)
-def get_my_submission(
+async def get_my_submission(
     contest_id: str,
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get student's own submission for a contest"""
-    contest = session.get(Contest, contest_id)
-    if not contest:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contest not found"
-        )
-    
-    # Check if student is enrolled in the contest's course
-    enrollment = session.exec(
-        select(StudentCourse).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.course_id == contest.course_id,
-            StudentCourse.is_active == True
-        )
-    ).first()
-    
-    if not enrollment:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not enrolled in this contest's course"
-        )
-    
-    # Get student's submission
-    submission = session.exec(
-        select(Submission).where(
-            Submission.contest_id == contest_id,
-            Submission.student_id == current_student.id
-        )
-    ).first()
-    
-    if not submission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No submission found for this contest"
-        )
+    # Submission, contest and enrollment check in one query
+    submission, contest = await get_own_submission(session, contest_id, current_student.id)
     
     # Calculate percentage for response
     percentage = (submission.total_score / submission.max_possible_score * 100) if submission.max_possible_score > 0 else 0
     
-    return SubmissionResponse(
+    return SubmissionResponse.model_construct(
         id=submission.id,
         contest_id=submission.contest_id,
         student_id=submission.student_id,
@@ -1270,94 +1467,108 @@ def get_my_submission(
     )
 
 
+@dataclass(slots=True)
+class ProblemReview:
+    """One problem of a submission review: question, correct options and the student's result
+
+    A slotted dataclass rather than a dict per problem - orjson serializes it
+    natively, field order giving the key order.
+    """
+    id: str
+    title: str
+    description: str
+    option_a: Optional[str]
+    option_b: Optional[str]
+    option_c: Optional[str]
+    option_d: Optional[str]
+    explanation: Optional[str]
+    image_url: Optional[str]
+    marks: float
+    order_index: int
+    correct_options: List[str]
+    student_answer: Any
+    score: float
+    max_score: float
+    is_correct: bool
+
+
+def review_problem_entry(problem, student_answer, score_data: Dict) -> ProblemReview:
+    """Build the review entry for one REVIEW_PROBLEMS row from the stored score data"""
+    # Handle None values for Long Answer questions
+    try:
+        correct_options = ContestProblem.parse_correct_options(problem.correct_options)
+    except (ValueError, TypeError):
+        correct_options = []
+    
+    score = score_data.get("score", 0)
+    return ProblemReview(
+        id=problem.id,
+        title=problem.title,
+        description=problem.description,
+        option_a=problem.option_a,
+        option_b=problem.option_b,
+        option_c=problem.option_c,
+        option_d=problem.option_d,
+        explanation=problem.explanation,
+        image_url=problem.image_url,
+        marks=problem.marks,
+        order_index=problem.order_index,
+        correct_options=correct_options,
+        student_answer=student_answer,
+        score=score,
+        max_score=score_data.get("max_score", problem.marks),
+        is_correct=score == problem.marks
+    )
+
+
+def submission_review_etag(submission: Submission, contest: Contest) -> str:
+    """Weak ETag for a student's submission review
+
+    Changes when a manual review or keyword rescore rewrites the scores, or
+    when the contest is edited. Contest problems are frozen copies, so they
+    need no part in it.
+    """
+    digest = hashlib.md5(
+        f"{submission.id}:{submission.problem_scores}:{contest.updated_at.isoformat()}".encode()
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
 @router.get("/{contest_id}/my-submission-details")
-def get_my_submission_details(
+async def get_my_submission_details(
     contest_id: str,
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+    request: Request,
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get detailed submission data with questions, answers, and explanations for review"""
-    contest = session.get(Contest, contest_id)
-    if not contest:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contest not found"
-        )
-    
-    # Check if student is enrolled in the contest's course
-    enrollment = session.exec(
-        select(StudentCourse).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.course_id == contest.course_id,
-            StudentCourse.is_active == True
-        )
-    ).first()
-    
-    if not enrollment:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not enrolled in this contest's course"
-        )
-    
-    # Get student's submission
-    submission = session.exec(
-        select(Submission).where(
-            Submission.contest_id == contest_id,
-            Submission.student_id == current_student.id
-        )
-    ).first()
-    
-    if not submission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No submission found for this contest"
-        )
+    # Submission, contest and enrollment check in one query
+    submission, contest = await get_own_submission(session, contest_id, current_student.id)
+    
+    # 🚀 Revalidate instead of caching for a fixed time (scores can still be
+    # reviewed): an unchanged review skips the problems query and serialization
+    cache_headers = {
+        "ETag": submission_review_etag(submission, contest),
+        "Cache-Control": "private, no-cache"
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if cache_headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
     
-    # Get contest problems with details
-    statement = select(ContestProblem).where(
-        ContestProblem.contest_id == contest_id
-    ).order_by(ContestProblem.order_index)
-    problems = session.exec(statement).all()
+    # Get contest problems with the details the review shows
+    problems = (await session.exec(REVIEW_PROBLEMS, params={"contest_id": contest_id})).all()
     
     # Parse submission data
-    student_answers = json.loads(submission.answers)
-    problem_scores = json.loads(submission.problem_scores)
+    student_answers = orjson.loads(submission.answers)
+    problem_scores = orjson.loads(submission.problem_scores)
     
-    # Build detailed response
-    detailed_problems = []
-    for problem in problems:
-        # Handle None values for Long Answer questions
-        if problem.correct_options is not None:
-            try:
-                correct_options = json.loads(problem.correct_options)
-            except (json.JSONDecodeError, TypeError):
-                correct_options = []
-        else:
-            correct_options = []
-        
-        student_answer = student_answers.get(problem.id, [])
-        score_data = problem_scores.get(problem.id, {})
-        
-        detailed_problems.append({
-            "id": problem.id,
-            "title": problem.title,
-            "description": problem.description,
-            "option_a": problem.option_a,
-            "option_b": problem.option_b,
-            "option_c": problem.option_c,
-            "option_d": problem.option_d,
-            "explanation": problem.explanation,
-            "image_url": problem.image_url,
-            "marks": problem.marks,
-            "order_index": problem.order_index,
-            "correct_options": correct_options,
-            "student_answer": student_answer,
-            "score": score_data.get("score", 0),
-            "max_score": score_data.get("max_score", problem.marks),
-            "is_correct": score_data.get("score", 0) == problem.marks
-        })
+    # Build detailed response in one pass over the problems
+    detailed_problems = [
+        review_problem_entry(problem, student_answers.get(problem.id, []), problem_scores.get(problem.id, {}))
+        for problem in problems
+    ]
     
-    return {
+    return ContestJSONResponse({
         "submission": {
             "id": submission.id,
             "contest_id": submission.contest_id,
@@ -1376,74 +1587,38 @@ def get_my_submission_details(
             "end_time": contest.end_time
         },
         "problems": detailed_problems
-    } 
+    }, headers=cache_headers)
 
 
 @router.post("/{contest_id}/auto-submit", response_model=SubmissionResponse)
-def auto_submit_contest(
+async def auto_submit_contest(
     contest_id: str,
     submission_data: SubmissionCreate,
-    current_student: User = Depends(get_current_student),
-    session: Session = Depends(get_session)
+    current_student: User = Depends(get_current_student_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Auto-submit answers when contest time expires with timezone validation"""
-    contest = session.get(Contest, contest_id)
-    if not contest:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contest not found"
-        )
-    
-    # Check if student is enrolled in the contest's course
-    enrollment = session.exec(
-        select(StudentCourse).where(
-            StudentCourse.student_id == current_student.id,
-            StudentCourse.course_id == contest.course_id,
-            StudentCourse.is_active == True
-        )
-    ).first()
-    
-    if not enrollment:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not enrolled in this contest's course"
-        )
+    # Contest and enrollment check in one round-trip
+    contest = await get_contest_for_student(session, contest_id, current_student.id)
     
     # Validate timing for auto-submission (more lenient than regular submission)
     current_utc = now_utc()
-    contest_status = contest.get_status()
+    contest_status = contest.get_status(current_utc)
     
     # Auto-submission allowed during contest or just after it ends (within grace period)
-    grace_period = timedelta(minutes=2)  # 2-minute grace period for auto-submission
-    
     if current_utc < contest.start_time:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Contest hasn't started yet. Auto-submission not allowed."
         )
-    elif current_utc > (contest.end_time + grace_period):
+    elif current_utc > (contest.end_time + AUTO_SUBMIT_GRACE_PERIOD):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Grace period for auto-submission has expired"
         )
     
-    # Check if student already submitted
-    existing_submission = session.exec(
-        select(Submission).where(
-            Submission.contest_id == contest_id,
-            Submission.student_id == current_student.id
-        )
-    ).first()
-    
-    if existing_submission:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already submitted for this contest"
-        )
-    
     # Get contest problems for scoring
-    statement = select(ContestProblem).where(ContestProblem.contest_id == contest_id)
-    problems = session.exec(statement).all()
+    problems = (await session.exec(CONTEST_PROBLEMS, params={"contest_id": contest_id})).all()
     
     if not problems:
         raise HTTPException(
@@ -1464,110 +1639,36 @@ def auto_submit_contest(
             # Contest ended - use full contest duration
             time_taken = int((contest.end_time - contest.start_time).total_seconds())
     
-    # Calculate score for auto-submission
-    total_score = 0.0
-    max_possible_score = 0.0
-    problem_scores = {}
-    
-    for problem in problems:
-        max_possible_score += problem.marks
-        
-        # Get student's answer for this problem (empty if not answered)
-        student_answer = answers.get(problem.id, [])
-        
-        # Handle different question types for auto-submission
-        if problem.question_type.value == "mcq":
-            # MCQ auto-scoring logic
-            try:
-                correct_options = json.loads(problem.correct_options) if problem.correct_options else []
-            except (json.JSONDecodeError, TypeError):
-                correct_options = []
-            
-            # Validate answer format (skip invalid answers for auto-submission)
-            if not isinstance(student_answer, list):
-                student_answer = []
-            
-            # Filter out invalid options
-            valid_options = {"A", "B", "C", "D"}
-            student_answer = [opt for opt in student_answer if opt in valid_options]
-            
-            # Score using exact set matching
-            if set(student_answer) == set(correct_options):
-                score = problem.marks
-                total_score += score
-            else:
-                score = 0.0
-                
-            correct_options_for_response = correct_options
-            
-        else:
-            # Long Answer auto-submission
-            correct_options_for_response = []
-            
-            # For Long Answer, student_answer should be a string
-            if not isinstance(student_answer, str):
-                student_answer = ""
-            
-            # Apply keyword scoring if configured
-            if problem.scoring_type == ScoringType.KEYWORD_BASED and problem.keywords_for_scoring:
-                try:
-                    scoring_result = calculate_keyword_score(
-                        student_answer, 
-                        problem.keywords_for_scoring, 
-                        problem.marks
-                    )
-                    score = scoring_result.score
-                    
-                    keyword_analysis = {
-                        "found_keywords": scoring_result.found_keywords,
-                        "missing_keywords": scoring_result.missing_keywords,
-                        "match_details": scoring_result.match_details,
-                        "auto_scored": True,
-                        "scoring_method": "keyword_based"
-                    }
-                    
-                except Exception as e:
-                    score = 0.0
-                    keyword_analysis = {
-                        "error": str(e),
-                        "auto_scored": False,
-                        "scoring_method": "manual_fallback"
-                    }
-            else:
-                score = 0.0
-                keyword_analysis = {
-                    "auto_scored": False,
-                    "scoring_method": "manual"
-                }
-        
-        problem_scores[problem.id] = {
-            "score": score,
-            "max_score": problem.marks,
-            "student_answer": student_answer,
-            "correct_answer": correct_options_for_response,
-            "keyword_analysis": keyword_analysis if problem.question_type.value == "long_answer" else None
-        }
+    # Calculate score for auto-submission. Keyword matching over long answers
+    # is CPU-bound, so it runs in the threadpool instead of stalling the event
+    # loop while the deadline burst of auto-submits is being handled
+    if any(problem.scoring_type == ScoringType.KEYWORD_BASED for problem in problems):
+        total_score, max_possible_score, problem_scores = await run_in_threadpool(
+            score_auto_submission, problems, answers
+        )
+    else:
+        total_score, max_possible_score, problem_scores = score_auto_submission(problems, answers)
     
     # Create auto-submission with timezone-aware timestamp
     submission = Submission(
         contest_id=contest_id,
         student_id=current_student.id,
-        answers=json.dumps(answers),
+        answers=orjson.dumps(answers).decode(),
         total_score=total_score,
         max_possible_score=max_possible_score,
         time_taken_seconds=time_taken,
-        problem_scores=json.dumps(problem_scores),
-        is_auto_submitted=True
+        problem_scores=orjson.dumps(problem_scores).decode(),
+        is_auto_submitted=True,
+        # Same clock reading the grace period was checked against
+        submitted_at=current_utc
     )
     
-    session.add(submission)
-    session.commit()
-    session.refresh(submission)
+    await save_submission(session, submission)
     
     # Calculate percentage for response
     percentage = (submission.total_score / submission.max_possible_score * 100) if submission.max_possible_score > 0 else 0
     
-    return SubmissionResponse(
+    return SubmissionResponse.model_construct(
         id=submission.id,
         contest_id=submission.contest_id,
         student_id=submission.student_id,
@@ -1582,13 +1683,13 @@ def auto_submit_contest(
 
 
 @router.delete("/{contest_id}", response_model=ContestResponse)
-def delete_contest(
+async def delete_contest(
     contest_id: str,
-    current_admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    current_admin: User = Depends(get_current_admin_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Delete a contest (only if not started)"""
-    contest = session.get(Contest, contest_id)
+    contest = await session.get(Contest, contest_id)
     if not contest:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1596,7 +1697,7 @@ def delete_contest(
         )
     
     # Check if admin owns the course
-    course = session.get(Course, contest.course_id)
+    course = await session.get(Course, contest.course_id)
     if not course or course.instructor_id != current_admin.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1604,16 +1705,15 @@ def delete_contest(
         )
     
     # Check if contest can be deleted (only if not started)
-    if not contest.can_be_deleted():
+    contest_status = contest.get_status()
+    if contest_status != ContestStatus.NOT_STARTED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete contest that has already started"
         )
     
     # Check if there are any submissions for this contest
-    existing_submissions = session.exec(
-        select(Submission).where(Submission.contest_id == contest_id)
-    ).first()
+    existing_submissions = await has_submission(session, contest_id)
     
     if existing_submissions:
         raise HTTPException(
@@ -1622,47 +1722,29 @@ def delete_contest(
         )
     
     # Store contest data for response before deletion
-    contest_response_data = {
-        "id": contest.id,
-        "course_id": contest.course_id,
-        "name": contest.name,
-        "description": contest.description,
-        "is_active": contest.is_active,
-        "start_time": contest.start_time,
-        "end_time": contest.end_time,
-        "status": contest.get_status(),
-        "created_at": contest.created_at,
-        "timezone": "UTC",
-        "duration_seconds": int((contest.end_time - contest.start_time).total_seconds()),
-        "can_be_deleted": contest.can_be_deleted()
-    }
+    contest_response_data = contest_response_fields(contest, contest_status)
     
     try:
         # First, get all contest problems
-        contest_problems = session.exec(
+        contest_problems = (await session.exec(
             select(ContestProblem).where(ContestProblem.contest_id == contest_id)
-        ).all()
+        )).all()
         
         # Delete all contest problems one by one
         for problem in contest_problems:
-            session.delete(problem)
+            await session.delete(problem)
         
-        # Explicitly commit contest problem deletions first
-        session.commit()
+        # Flush problem deletions before the contest to satisfy the foreign key
+        await session.flush()
         
-        # Create a new session for the contest deletion to avoid stale references
-        from app.core.database import get_session
-        with next(get_session()) as new_session:
-            # Get the contest in the new session
-            contest_to_delete = new_session.get(Contest, contest_id)
-            if contest_to_delete:
-                new_session.delete(contest_to_delete)
-                new_session.commit()
+        await session.delete(contest)
+        await session.commit()
+        invalidate_contest_cache(contest_id)
         
-        return ContestResponse(**contest_response_data)
+        return ContestResponse.model_construct(**contest_response_data)
         
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete contest: {str(e)}"
@@ -1670,14 +1752,14 @@ def delete_contest(
 
 
 @router.patch("/{contest_id}/status", response_model=ContestResponse)
-def update_contest_status(
+async def update_contest_status(
     contest_id: str,
     status_data: ContestStatusUpdate,
-    current_admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    current_admin: User = Depends(get_current_admin_async),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Enable or disable a contest"""
-    contest = session.get(Contest, contest_id)
+    contest = await session.get(Contest, contest_id)
     if not contest:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1685,7 +1767,7 @@ def update_contest_status(
         )
     
     # Check if admin owns the course
-    course = session.get(Course, contest.course_id)
+    course = await session.get(Course, contest.course_id)
     if not course or course.instructor_id != current_admin.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1696,23 +1778,12 @@ def update_contest_status(
     contest.is_active = status_data.is_active
     
     # Update timestamp
-    contest.updated_at = now_utc()
+    current_utc = now_utc()
+    contest.updated_at = current_utc
     
     session.add(contest)
-    session.commit()
-    session.refresh(contest)
-    
-    return ContestResponse(
-        id=contest.id,
-        course_id=contest.course_id,
-        name=contest.name,
-        description=contest.description,
-        is_active=contest.is_active,
-        start_time=contest.start_time,
-        end_time=contest.end_time,
-        status=contest.get_status(),
-        created_at=contest.created_at,
-        timezone="UTC",
-        duration_seconds=int((contest.end_time - contest.start_time).total_seconds()),
-        can_be_deleted=contest.can_be_deleted()
-    ) 
\ No newline at end of file
+    await session.commit()
+    invalidate_contest_cache(contest_id)
+    
+    contest_status = contest.get_status(current_utc)
+    return ContestResponse.model_construct(**contest_response_fields(contest, contest_status)) 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
-from sqlmodel import Session, select
-from typing import List, Optional
-from datetime import datetime
+from sqlmodel import Session, select, func
+from typing import List, Optional, Dict
+from datetime import datetime, timezone
 import csv
 import io
 from fastapi.responses import StreamingResponse
@@ -19,6 +19,19 @@ from app.schemas.student import EnrolledStudentResponse
 router = APIRouter(prefix="/courses", tags=["Courses"])
 
 
+def count_active_enrollments(session: Session, course_ids: List[str]) -> Dict[str, int]:
+    """Active enrollment count per course, counted in the database with one grouped query"""
+    if not course_ids:
+        return {}
+    rows = session.exec(
+        select(StudentCourse.course_id, func.count()).where(
+            StudentCourse.course_id.in_(course_ids),
+            StudentCourse.is_active == True
+        ).group_by(StudentCourse.course_id)
+    ).all()
+    return dict(rows)
+
+
 @router.post("/", response_model=CourseResponse)
 def create_course(
     course_data: CourseCreate,
@@ -77,16 +90,11 @@ def list_courses(
     statement = statement.offset(skip).limit(limit).order_by(Course.created_at.desc())
     courses = session.exec(statement).all()
     
-    # Calculate enrollment counts for each course
+    # Calculate enrollment counts for every course in one query
+    enrollment_counts = count_active_enrollments(session, [course.id for course in courses])
     course_responses = []
     for course in courses:
-        # Count active enrollments for this course
-        enrollment_count = len(session.exec(
-            select(StudentCourse).where(
-                StudentCourse.course_id == course.id,
-                StudentCourse.is_active == True
-            )
-        ).all())
+        enrollment_count = enrollment_counts.get(course.id, 0)
         
         course_responses.append(CourseResponse(
             id=course.id,
@@ -117,13 +125,13 @@ def get_course(
     
     # Check permissions
     if current_user.role == UserRole.STUDENT:
-        # Check if student is enrolled in this course
+        # Check if student is enrolled in this course (id only - no entity to hydrate)
         enrollment = session.exec(
-            select(StudentCourse).where(
+            select(StudentCourse.id).where(
                 StudentCourse.student_id == current_user.id,
                 StudentCourse.course_id == course_id,
                 StudentCourse.is_active == True
-            )
+            ).limit(1)
         ).first()
         
         if not enrollment:
@@ -146,12 +154,7 @@ def get_course(
         instructor_id=course.instructor_id,
         created_at=course.created_at,
         updated_at=course.updated_at,
-        enrollment_count=len(session.exec(
-            select(StudentCourse).where(
-                StudentCourse.course_id == course.id,
-                StudentCourse.is_active == True
-            )
-        ).all())
+        enrollment_count=count_active_enrollments(session, [course.id]).get(course.id, 0)
     )
 
 
@@ -182,7 +185,7 @@ def update_course(
     for field, value in update_data.items():
         setattr(course, field, value)
     
-    course.updated_at = datetime.utcnow()
+    course.updated_at = datetime.now(timezone.utc)
     
     session.add(course)
     session.commit()
@@ -195,12 +198,7 @@ def update_course(
         instructor_id=course.instructor_id,
         created_at=course.created_at,
         updated_at=course.updated_at,
-        enrollment_count=len(session.exec(
-            select(StudentCourse).where(
-                StudentCourse.course_id == course.id,
-                StudentCourse.is_active == True
-            )
-        ).all())
+        enrollment_count=count_active_enrollments(session, [course.id]).get(course.id, 0)
     )
 
 
@@ -226,11 +224,6 @@ def delete_course(
         )
     
     try:
-        # First, get counts for deletion summary
-        enrollment_count = len(session.exec(
-            select(StudentCourse).where(StudentCourse.course_id == course_id)
-        ).all())
-        
         # Import Contest and related models to avoid circular imports
         from app.models.contest import Contest, ContestProblem
         from app.models.submission import Submission
@@ -246,6 +239,7 @@ def delete_course(
         enrollments = session.exec(
             select(StudentCourse).where(StudentCourse.course_id == course_id)
         ).all()
+        enrollment_count = len(enrollments)  # For the deletion summary
         for enrollment in enrollments:
             session.delete(enrollment)
         
@@ -342,7 +336,7 @@ def enroll_students(
             if not existing_enrollment.is_active:
                 # Reactivate enrollment
                 existing_enrollment.is_active = True
-                existing_enrollment.enrolled_at = datetime.utcnow()
+                existing_enrollment.enrolled_at = datetime.now(timezone.utc)
                 session.add(existing_enrollment)
                 enrolled_count += 1
             else:
@@ -545,7 +539,7 @@ async def enroll_students_csv(
                     if not existing_enrollment.is_active:
                         # Reactivate enrollment
                         existing_enrollment.is_active = True
-                        existing_enrollment.enrolled_at = datetime.utcnow()
+                        existing_enrollment.enrolled_at = datetime.now(timezone.utc)
                         session.add(existing_enrollment)
                         enrolled_count += 1
                         enrolled_students.append({
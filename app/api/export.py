@@ -3,7 +3,7 @@ from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
 from typing import List, Dict, Any
 import pandas as pd
-import json
+import orjson
 from io import BytesIO
 from datetime import datetime
 
@@ -57,16 +57,12 @@ def export_contest_results(
     ).order_by(User.email)
     students = session.exec(students_stmt).all()
     
-    # Get submissions with student info
-    submissions_stmt = select(Submission, User).join(
-        User, Submission.student_id == User.id
-    ).where(Submission.contest_id == contest_id)
-    submission_results = session.exec(submissions_stmt).all()
-    
-    # Create submission lookup
-    submissions_dict = {}
-    for submission, student in submission_results:
-        submissions_dict[student.id] = submission
+    # Get submissions - the student rows are already loaded above, so no
+    # User join is needed just to key them by student id
+    submissions_stmt = select(Submission).where(Submission.contest_id == contest_id)
+    submissions_dict = {
+        submission.student_id: submission for submission in session.exec(submissions_stmt).all()
+    }
     
     # Prepare data for Excel
     excel_data = []
@@ -91,7 +87,7 @@ def export_contest_results(
             
             # Add problem-wise scores
             try:
-                problem_scores = json.loads(submission.problem_scores)
+                problem_scores = orjson.loads(submission.problem_scores)
                 for problem in problems:
                     problem_data = problem_scores.get(problem.id, {})
                     row[f"Q{problem.order_index + 1} Score"] = problem_data.get("score", 0)
@@ -102,7 +98,7 @@ def export_contest_results(
                     correct_answer = problem_data.get("correct_answer", [])
                     row[f"Q{problem.order_index + 1} Student Answer"] = ", ".join(student_answer) if student_answer else "No Answer"
                     row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_answer)
-            except (json.JSONDecodeError, KeyError):
+            except (orjson.JSONDecodeError, KeyError):
                 # Handle cases where problem_scores is malformed
                 for problem in problems:
                     row[f"Q{problem.order_index + 1} Score"] = 0
@@ -110,11 +106,11 @@ def export_contest_results(
                     row[f"Q{problem.order_index + 1} Student Answer"] = "Error"
                     try:
                         if problem.correct_options is not None:
-                            correct_options = json.loads(problem.correct_options)
+                            correct_options = problem.get_correct_options()
                             row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_options)
                         else:
                             row[f"Q{problem.order_index + 1} Correct Answer"] = "Long Answer Question"
-                    except (json.JSONDecodeError, TypeError):
+                    except (orjson.JSONDecodeError, TypeError):
                         row[f"Q{problem.order_index + 1} Correct Answer"] = "Error parsing options"
         else:
             # Student didn't submit
@@ -134,11 +130,11 @@ def export_contest_results(
                 row[f"Q{problem.order_index + 1} Student Answer"] = "Not Submitted"
                 try:
                     if problem.correct_options is not None:
-                        correct_options = json.loads(problem.correct_options)
+                        correct_options = problem.get_correct_options()
                         row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_options)
                     else:
                         row[f"Q{problem.order_index + 1} Correct Answer"] = "Long Answer Question"
-                except (json.JSONDecodeError, TypeError):
+                except (orjson.JSONDecodeError, TypeError):
                     row[f"Q{problem.order_index + 1} Correct Answer"] = "Error parsing options"
         
         excel_data.append(row)
@@ -188,11 +184,11 @@ def export_contest_results(
         for problem in problems:
             try:
                 if problem.correct_options is not None:
-                    correct_options = json.loads(problem.correct_options)
+                    correct_options = problem.get_correct_options()
                     correct_options_str = ", ".join(correct_options)
                 else:
                     correct_options_str = "Long Answer Question"
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 correct_options_str = "Error parsing options"
                 
             problem_details.append({
@@ -263,16 +259,12 @@ def export_contest_results_csv(
     ).order_by(User.email)
     students = session.exec(students_stmt).all()
     
-    # Get submissions with student info
-    submissions_stmt = select(Submission, User).join(
-        User, Submission.student_id == User.id
-    ).where(Submission.contest_id == contest_id)
-    submission_results = session.exec(submissions_stmt).all()
-    
-    # Create submission lookup
-    submissions_dict = {}
-    for submission, student in submission_results:
-        submissions_dict[student.id] = submission
+    # Get submissions - the student rows are already loaded above, so no
+    # User join is needed just to key them by student id
+    submissions_stmt = select(Submission).where(Submission.contest_id == contest_id)
+    submissions_dict = {
+        submission.student_id: submission for submission in session.exec(submissions_stmt).all()
+    }
     
     # Prepare comprehensive data for CSV (same as Excel)
     csv_data = []
@@ -297,7 +289,7 @@ def export_contest_results_csv(
             
             # Add problem-wise scores
             try:
-                problem_scores = json.loads(submission.problem_scores)
+                problem_scores = orjson.loads(submission.problem_scores)
                 for problem in problems:
                     problem_data = problem_scores.get(problem.id, {})
                     row[f"Q{problem.order_index + 1} Score"] = problem_data.get("score", 0)
@@ -308,7 +300,7 @@ def export_contest_results_csv(
                     correct_answer = problem_data.get("correct_answer", [])
                     row[f"Q{problem.order_index + 1} Student Answer"] = ", ".join(student_answer) if student_answer else "No Answer"
                     row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_answer)
-            except (json.JSONDecodeError, KeyError):
+            except (orjson.JSONDecodeError, KeyError):
                 # Handle cases where problem_scores is malformed
                 for problem in problems:
                     row[f"Q{problem.order_index + 1} Score"] = 0
@@ -316,11 +308,11 @@ def export_contest_results_csv(
                     row[f"Q{problem.order_index + 1} Student Answer"] = "Error"
                     try:
                         if problem.correct_options is not None:
-                            correct_options = json.loads(problem.correct_options)
+                            correct_options = problem.get_correct_options()
                             row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_options)
                         else:
                             row[f"Q{problem.order_index + 1} Correct Answer"] = "Long Answer Question"
-                    except (json.JSONDecodeError, TypeError):
+                    except (orjson.JSONDecodeError, TypeError):
                         row[f"Q{problem.order_index + 1} Correct Answer"] = "Error parsing options"
         else:
             # Student didn't submit
@@ -340,11 +332,11 @@ def export_contest_results_csv(
                 row[f"Q{problem.order_index + 1} Student Answer"] = "Not Submitted"
                 try:
                     if problem.correct_options is not None:
-                        correct_options = json.loads(problem.correct_options)
+                        correct_options = problem.get_correct_options()
                         row[f"Q{problem.order_index + 1} Correct Answer"] = ", ".join(correct_options)
                     else:
                         row[f"Q{problem.order_index + 1} Correct Answer"] = "Long Answer Question"
-                except (json.JSONDecodeError, TypeError):
+                except (orjson.JSONDecodeError, TypeError):
                     row[f"Q{problem.order_index + 1} Correct Answer"] = "Error parsing options"
         
         csv_data.append(row)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select, func, exists
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from io import BytesIO
 import json
 import csv
@@ -13,7 +13,7 @@ from uuid import uuid4
 from app.core.database import get_session, safe_database_operation
 from app.utils.auth import get_current_admin
 from app.models.user import User
-from app.models.mcq_problem import MCQProblem, QuestionType, ScoringType
+from app.models.mcq_problem import MCQProblem, QuestionType, ScoringType, MCQ_OPTION_LABELS, VALID_MCQ_OPTIONS
 from app.models.tag import Tag, MCQTag
 from app.schemas.mcq import (
     MCQProblemCreate, 
@@ -48,12 +48,11 @@ def create_question(
             )
         
         # Validate correct options for MCQ
-        valid_options = ["A", "B", "C", "D"]
         for option in problem_data.correct_options:
-            if option not in valid_options:
+            if option not in VALID_MCQ_OPTIONS:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid option: {option}. Must be one of {valid_options}"
+                    detail=f"Invalid option: {option}. Must be one of {list(MCQ_OPTION_LABELS)}"
                 )
         
         if not problem_data.correct_options:
@@ -414,12 +413,11 @@ def update_mcq_problem(
     
     # Validate correct options if provided
     if problem_data.correct_options is not None:
-        valid_options = ["A", "B", "C", "D"]
         for option in problem_data.correct_options:
-            if option not in valid_options:
+            if option not in VALID_MCQ_OPTIONS:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid option: {option}. Must be one of {valid_options}"
+                    detail=f"Invalid option: {option}. Must be one of {list(MCQ_OPTION_LABELS)}"
                 )
         
         if not problem_data.correct_options:
@@ -453,7 +451,7 @@ def update_mcq_problem(
             else:
                 setattr(problem, field, value)
         
-        problem.updated_at = datetime.utcnow()
+        problem.updated_at = datetime.now(timezone.utc)
         
         # Update tags if provided
         if problem_data.tag_ids is not None:
@@ -756,10 +754,9 @@ def bulk_import_mcq_problems(
                         correct_options = [correct_options_str.strip().upper()]
                     
                     # Validate correct options
-                    valid_options = ["A", "B", "C", "D"]
                     for option in correct_options:
-                        if option not in valid_options:
-                            results["errors"].append(f"Row {line_num}: Invalid correct option '{option}'. Must be one of {valid_options}")
+                        if option not in VALID_MCQ_OPTIONS:
+                            results["errors"].append(f"Row {line_num}: Invalid correct option '{option}'. Must be one of {list(MCQ_OPTION_LABELS)}")
                             results["failed"] += 1
                             continue
                     
@@ -780,7 +777,7 @@ def bulk_import_mcq_problems(
                 # Check for duplicate questions based on content
                 correct_options_json = json.dumps(correct_options)
                 existing_question = session.exec(
-                    select(MCQProblem).where(
+                    select(MCQProblem.id).where(
                         MCQProblem.title == title,
                         MCQProblem.description == description,
                         MCQProblem.option_a == option_a,
@@ -788,7 +785,7 @@ def bulk_import_mcq_problems(
                         MCQProblem.option_c == option_c,
                         MCQProblem.option_d == option_d,
                         MCQProblem.correct_options == correct_options_json
-                    )
+                    ).limit(1)
                 ).first()
                 
                 if existing_question:
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.database import get_session
 from app.core.security import create_access_token
@@ -210,7 +210,7 @@ async def verify_otpless_token(
             existing_user.profile_picture = user_data.get("profile_picture")
             existing_user.auth_provider = user_data.get("auth_provider", "otpless")
             existing_user.registration_status = RegistrationStatus.ACTIVE
-            existing_user.updated_at = datetime.utcnow()
+            existing_user.updated_at = datetime.now(timezone.utc)
             
             session.add(existing_user)
             session.commit()
@@ -252,7 +252,7 @@ async def verify_otpless_token(
             if user_data.get("profile_picture") and not existing_user.profile_picture:
                 existing_user.profile_picture = user_data["profile_picture"]
             
-            existing_user.updated_at = datetime.utcnow()
+            existing_user.updated_at = datetime.now(timezone.utc)
             session.add(existing_user)
             session.commit()
             session.refresh(existing_user)
@@ -390,7 +390,7 @@ def complete_profile(
                             existing_user.auth_provider = current_user.auth_provider
                             existing_user.registration_status = RegistrationStatus.ACTIVE
                             existing_user.profile_completed = True
-                            existing_user.updated_at = datetime.utcnow()
+                            existing_user.updated_at = datetime.now(timezone.utc)
                             
                             # Update the user record
                             session.add(existing_user)
@@ -466,7 +466,7 @@ def complete_profile(
         current_user.email = profile_data.email
         current_user.date_of_birth = profile_data.date_of_birth
         current_user.profile_completed = True
-        current_user.updated_at = datetime.utcnow()
+        current_user.updated_at = datetime.now(timezone.utc)
         
         session.add(current_user)
         session.commit()
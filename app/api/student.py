@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, BackgroundTasks
 from fastapi.responses import StreamingResponse
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from io import BytesIO
@@ -15,6 +15,7 @@ from app.utils.phone_utils import validate_and_normalize_mobile, MobileValidatio
 from app.core.security import get_password_hash
 from app.api.auth import generate_random_password
 from app.models.user import User, UserRole, RegistrationStatus, VerificationMethod
+from app.schemas.auth import normalize_email
 from app.schemas.student import (
     StudentCreate, StudentResponse, StudentUpdate,
     BulkImportWithEmailRequest, SendInvitationsRequest, BulkEmailRequest,
@@ -521,7 +522,7 @@ def create_student(
 ):
     """Create a new student"""
     # Check if email already exists
-    statement = select(User).where(User.email == student_data.email)
+    statement = select(User.id).where(func.lower(User.email) == student_data.email).limit(1)
     existing_user = session.exec(statement).first()
     
     if existing_user:
@@ -563,7 +564,7 @@ async def create_preregistered_student(
     session: Session = Depends(get_session)
 ):
     """Create a pre-registered student with email and mobile"""
-    email = student_data.get('email')
+    email = normalize_email(student_data.get('email'))
     mobile = student_data.get('mobile')
     
     if not email or not mobile:
@@ -582,7 +583,7 @@ async def create_preregistered_student(
         )
     
     # Check if email already exists
-    statement = select(User).where(User.email == email)
+    statement = select(User.id).where(func.lower(User.email) == email).limit(1)
     existing_user_email = session.exec(statement).first()
     
     if existing_user_email:
@@ -592,7 +593,7 @@ async def create_preregistered_student(
         )
     
     # Check if mobile already exists
-    statement = select(User).where(User.mobile == mobile_normalized)
+    statement = select(User.id).where(User.mobile == mobile_normalized).limit(1)
     existing_user_mobile = session.exec(statement).first()
     
     if existing_user_mobile:
@@ -1121,7 +1122,7 @@ def bulk_import_students(
                 
                 # Check if email already exists
                 existing_user_email = session.exec(
-                    select(User).where(User.email == email)
+                    select(User.id).where(func.lower(User.email) == email).limit(1)
                 ).first()
                 
                 if existing_user_email:
@@ -1131,7 +1132,7 @@ def bulk_import_students(
                 
                 # Check if mobile already exists
                 existing_user_mobile = session.exec(
-                    select(User).where(User.mobile == mobile_normalized)
+                    select(User.id).where(User.mobile == mobile_normalized).limit(1)
                 ).first()
                 
                 if existing_user_mobile:
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session, select
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
-import json
+import orjson
 
 from app.core.database import get_session
 from app.core.performance import monitor_performance, rate_limit
@@ -64,11 +64,18 @@ def get_pending_reviews(
     
     results = session.exec(query).all()
     
+    # Titles of every problem in the listed contests, loaded in one query
+    # instead of a lookup per review item
+    contest_ids = {contest.id for _, contest, _, _ in results}
+    problem_titles = dict(session.exec(
+        select(ContestProblem.id, ContestProblem.title).where(ContestProblem.contest_id.in_(contest_ids))
+    ).all()) if contest_ids else {}
+    
     pending_reviews = []
     
     for submission, contest, course, student in results:
         try:
-            problem_scores = json.loads(submission.problem_scores) if submission.problem_scores else {}
+            problem_scores = orjson.loads(submission.problem_scores) if submission.problem_scores else {}
             
             # Check for long answer questions that need review
             review_items = []
@@ -118,8 +125,8 @@ def get_pending_reviews(
                                 continue
                     
                     # Get problem details (using ContestProblem, not MCQProblem)
-                    problem = session.get(ContestProblem, problem_id)
-                    if not problem:
+                    problem_title = problem_titles.get(problem_id)
+                    if problem_title is None:
                         print(f"DEBUG: ContestProblem {problem_id} not found in database")
                         continue
                     
@@ -127,7 +134,7 @@ def get_pending_reviews(
                         print(f"DEBUG: Adding review item for problem {problem_id}, contest {contest.name}, scoring_method: {keyword_analysis.get('scoring_method')}, auto_scored: {keyword_analysis.get('auto_scored')}, error: {keyword_analysis.get('error')}")
                         review_items.append({
                             "problem_id": problem_id,
-                            "problem_title": problem.title[:100] + "..." if len(problem.title) > 100 else problem.title,
+                            "problem_title": problem_title[:100] + "..." if len(problem_title) > 100 else problem_title,
                             "student_answer": score_data.get('student_answer', '')[:200] + "..." if len(score_data.get('student_answer', '')) > 200 else score_data.get('student_answer', ''),
                             "current_score": score_data.get('score', 0),
                             "max_score": score_data.get('max_score', 0),
@@ -206,9 +213,9 @@ def get_submission_for_review(
     
     # Parse problem scores and get detailed data
     try:
-        problem_scores = json.loads(submission.problem_scores) if submission.problem_scores else {}
-        submission_answers = json.loads(submission.answers) if submission.answers else {}
-    except json.JSONDecodeError:
+        problem_scores = orjson.loads(submission.problem_scores) if submission.problem_scores else {}
+        submission_answers = orjson.loads(submission.answers) if submission.answers else {}
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Invalid submission data"
@@ -291,8 +298,8 @@ def update_submission_review(
         )
     
     try:
-        problem_scores = json.loads(submission.problem_scores) if submission.problem_scores else {}
-    except json.JSONDecodeError:
+        problem_scores = orjson.loads(submission.problem_scores) if submission.problem_scores else {}
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Invalid submission data"
@@ -342,7 +349,7 @@ def update_submission_review(
     # Update total score
     new_total_score = submission.total_score + total_score_change
     submission.total_score = new_total_score
-    submission.problem_scores = json.dumps(problem_scores)
+    submission.problem_scores = orjson.dumps(problem_scores).decode()
     
     session.add(submission)
     session.commit()
@@ -385,9 +392,9 @@ def rescore_with_keywords(
         )
     
     try:
-        problem_scores = json.loads(submission.problem_scores) if submission.problem_scores else {}
-        submission_answers = json.loads(submission.answers) if submission.answers else {}
-    except json.JSONDecodeError:
+        problem_scores = orjson.loads(submission.problem_scores) if submission.problem_scores else {}
+        submission_answers = orjson.loads(submission.answers) if submission.answers else {}
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Invalid submission data"
@@ -462,7 +469,7 @@ def rescore_with_keywords(
     if rescored_problems:
         # Update total score
         submission.total_score += total_score_change
-        submission.problem_scores = json.dumps(problem_scores)
+        submission.problem_scores = orjson.dumps(problem_scores).decode()
         
         session.add(submission)
         session.commit()
@@ -526,7 +533,7 @@ def get_review_analytics(
     
     for submission, contest, course in results:
         try:
-            problem_scores = json.loads(submission.problem_scores) if submission.problem_scores else {}
+            problem_scores = orjson.loads(submission.problem_scores) if submission.problem_scores else {}
             
             for problem_id, score_data in problem_scores.items():
                 keyword_analysis = score_data.get('keyword_analysis')
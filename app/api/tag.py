@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session, select, func
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.database import get_session
 from app.utils.auth import get_current_admin, get_current_user
@@ -25,7 +25,7 @@ def create_tag(
     """Create a new tag"""
     # Check if tag with same name already exists
     existing_tag = session.exec(
-        select(Tag).where(Tag.name.ilike(tag_data.name))
+        select(Tag.id).where(Tag.name.ilike(tag_data.name)).limit(1)
     ).first()
     
     if existing_tag:
@@ -169,7 +169,7 @@ def update_tag(
     # Check for name conflicts if name is being updated
     if tag_data.name and tag_data.name != tag.name:
         existing_tag = session.exec(
-            select(Tag).where(Tag.name.ilike(tag_data.name), Tag.id != tag_id)
+            select(Tag.id).where(Tag.name.ilike(tag_data.name), Tag.id != tag_id).limit(1)
         ).first()
         
         if existing_tag:
@@ -186,7 +186,7 @@ def update_tag(
         else:
             setattr(tag, field, value)
     
-    tag.updated_at = datetime.utcnow()
+    tag.updated_at = datetime.now(timezone.utc)
     
     session.add(tag)
     session.commit()
@@ -8,9 +8,9 @@ Designed for 100+ concurrent students scenarios
 
 from typing import List, Dict, Any, Optional, Tuple
 from sqlmodel import Session, select
-from sqlalchemy import and_, or_, text
+from sqlalchemy import and_, or_, text, insert
 from datetime import datetime, timezone
-import json
+import orjson
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
@@ -112,23 +112,20 @@ class BulkOperations:
             submission = Submission(
                 contest_id=data["contest_id"],
                 student_id=data["student_id"],
-                answers=json.dumps(data["answers"]),
+                answers=orjson.dumps(data["answers"]).decode(),
                 total_score=data["total_score"],
                 max_possible_score=data["max_possible_score"],
                 time_taken_seconds=data["time_taken_seconds"],
-                problem_scores=json.dumps(data["problem_scores"]),
+                problem_scores=orjson.dumps(data["problem_scores"]).decode(),
                 is_auto_submitted=data.get("is_auto_submitted", False)
             )
             submissions.append(submission)
         
-        # Bulk insert
-        self.session.add_all(submissions)
+        # Bulk insert: one executemany, and no refresh per row - ids and
+        # submitted_at are generated in Python, so the objects are complete
+        self.session.exec(insert(Submission), params=[submission.model_dump() for submission in submissions])
         self.session.commit()
         
-        # Refresh all to get IDs
-        for submission in submissions:
-            self.session.refresh(submission)
-        
         return submissions
     
     # 📊 BULK STATISTICS QUERIES
@@ -226,7 +223,7 @@ class AsyncBulkOperations:
                     
                     # Simple scoring logic (extend as needed)
                     if problem["question_type"] == "mcq":
-                        correct_options = json.loads(problem["correct_options"])
+                        correct_options = orjson.loads(problem["correct_options"])
                         if set(answer) == set(correct_options):
                             score = problem["marks"]
                         else:
@@ -8,6 +8,7 @@ No external dependencies (Redis-free design)
 
 import time
 import json
+import asyncio
 from functools import lru_cache, wraps
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timezone, timedelta
@@ -96,11 +97,28 @@ submission_cache = TTLCache(default_ttl=60)    # 1 minute for submissions
 def cache_with_ttl(cache_instance: TTLCache, ttl: Optional[int] = None, key_prefix: str = ""):
     """Decorator for caching function results with TTL"""
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        def make_cache_key(args, kwargs) -> str:
             # Generate cache key from function name and arguments
             key_data = f"{key_prefix}{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-            cache_key = hashlib.md5(key_data.encode()).hexdigest()
+            return hashlib.md5(key_data.encode()).hexdigest()
+        
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            cache_key = make_cache_key(args, kwargs)
+            
+            # Try to get from cache
+            cached_result = cache_instance.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+            
+            # Await and cache the result (never the coroutine object itself)
+            result = await func(*args, **kwargs)
+            cache_instance.set(cache_key, result, ttl)
+            return result
+        
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            cache_key = make_cache_key(args, kwargs)
             
             # Try to get from cache
             cached_result = cache_instance.get(cache_key)
@@ -112,6 +130,8 @@ def cache_with_ttl(cache_instance: TTLCache, ttl: Optional[int] = None, key_pref
             cache_instance.set(cache_key, result, ttl)
             return result
         
+        wrapper = async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        
         # Add cache management methods to the wrapper
         wrapper.cache_clear = lambda: cache_instance.clear()
         wrapper.cache_info = lambda: cache_instance.get_stats()
@@ -166,6 +186,16 @@ def get_contest_problems_cached(contest_id: str, problems_json: str) -> Dict[str
         "cached_at": datetime.now(timezone.utc).isoformat()
     }
 
+# 🏁 CONTEST ROW CACHE
+# Kept short because a contest edit only invalidates the worker process that
+# handled it (invalidate_contest_cache matches on the contest id in the key);
+# other workers converge within the TTL
+CONTEST_ROW_TTL = 30
+
+def contest_row_cache_key(contest_id: str) -> str:
+    """Cache key for a loaded Contest row (see get_cached_contest)"""
+    return f"contest:{contest_id}:row"
+
 # 🚀 CACHE WARMING FUNCTIONS
 def warm_contest_cache(contest_id: str, contest_data: Dict[str, Any]) -> None:
     """Pre-warm contest cache before contest starts"""
@@ -2,7 +2,8 @@ import time
 import logging
 from contextlib import contextmanager
 from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import QueuePool
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from .config import settings
@@ -92,16 +93,20 @@ try:
         pool_pre_ping=True,
         pool_recycle=3600,
         
-        # Async pool settings
-        pool_size=15,
-        max_overflow=25,
+        # Async pool settings - auth and contest endpoints run on this pool, so
+        # keep a warm base of connections and bound the burst
+        pool_size=20,
+        max_overflow=10,
         pool_timeout=30,
+        pool_reset_on_return="commit",
         
         # Psycopg async-specific optimizations  
         connect_args={
             "options": "-c timezone=UTC -c application_name=quiz_app_async",
             "connect_timeout": 10,
-            # Note: prepare_threshold removed for psycopg3 compatibility
+            # 🔧 Same as the sync engine: no server-side prepared statements,
+            # which conflict across pgbouncer transaction-pooled backends
+            "prepare_threshold": None,
         }
     )
 except Exception as e:
@@ -149,7 +154,9 @@ async def get_async_session():
     """Get async database session for high-performance operations"""
     if async_engine is None:
         raise RuntimeError("Async engine not available - falling back to sync operations")
-    async with AsyncSession(async_engine) as session:
+    # expire_on_commit=False: attribute access after commit would otherwise
+    # trigger an implicit (and in async, forbidden) refresh query
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
         yield session
 
 # 🔥 CONNECTION POOL MONITORING
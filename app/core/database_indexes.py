@@ -63,12 +63,8 @@ PERFORMANCE_INDEXES = [
     },
     
     # 📝 SUBMISSION PERFORMANCE INDEXES
-    {
-        "name": "idx_submission_contest_student",
-        "table": "submission",
-        "columns": ["contest_id", "student_id"],
-        "description": "Check existing submissions (prevent duplicates)"
-    },
+    # (contest_id, student_id) lookups use the unique ux_submission_contest_student
+    # declared on the Submission model
     {
         "name": "idx_submission_student_time",
         "table": "submission",
@@ -119,7 +115,7 @@ PARTIAL_INDEXES = [
         "table": "studentcourse",
         "columns": ["student_id", "course_id"],
         "condition": "is_active = true",
-        "description": "Only active enrollments matter for access"
+        "description": "Only active enrollments matter for access; also answers a student's active course IDs (/auth/me) with an index-only scan"
     },
     {
         "name": "idx_recent_submissions",
@@ -1,11 +1,21 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
+from jose import JWTError, jwt, jwk
 from passlib.context import CryptContext
 from .config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing - cost pinned by settings.bcrypt_rounds; hashes made at a
+# different cost are flagged by password_needs_rehash and upgraded on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
+
+
+# JWT key parsed once at import; passing a raw secret makes jose rebuild the
+# key object on every encode/decode
+JWT_KEY = jwk.construct(settings.jwt_secret_key, settings.jwt_algorithm)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -18,23 +28,28 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with outdated settings and should be replaced"""
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    encoded_jwt = jwt.encode(to_encode, JWT_KEY, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify and decode JWT token"""
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, JWT_KEY, algorithms=[settings.jwt_algorithm])
         return payload
     except JWTError:
         return None 
\ No newline at end of file
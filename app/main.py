@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -10,7 +11,9 @@ from app.api import auth, course, contest, export, student, otpless_auth, tag, m
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    # 🚀 orjson for every router that does not pick its own response class
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
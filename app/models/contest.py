@@ -1,7 +1,9 @@
 from sqlmodel import SQLModel, Field
-from typing import Optional
+from typing import Optional, List, Tuple, FrozenSet
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
+import orjson
 import uuid
 from sqlalchemy import Column, DateTime
 from .mcq_problem import QuestionType, ScoringType
@@ -36,14 +38,20 @@ class Contest(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True), nullable=False)
     )
     
-    def get_status(self) -> ContestStatus:
-        """Get current contest status based on time"""
+    def get_status(self, now: Optional[datetime] = None) -> ContestStatus:
+        """Get contest status based on time
+
+        Pass ``now`` to evaluate many contests (or several checks in one
+        request) against a single clock reading.
+        """
+        return Contest.status_between(self.start_time, self.end_time, now)
+    
+    @staticmethod
+    def status_between(start_time: datetime, end_time: datetime, now: Optional[datetime] = None) -> ContestStatus:
+        """Contest status for a start/end pair, e.g. from a column-only select"""
         # Use UTC time for consistent comparison across all timezones
-        now = datetime.now(timezone.utc)
-        
-        # Ensure contest times are timezone-aware for comparison
-        start_time = self.start_time
-        end_time = self.end_time
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         # If stored times are naive, assume they are UTC
         if start_time.tzinfo is None:
@@ -58,14 +66,30 @@ class Contest(SQLModel, table=True):
         else:
             return ContestStatus.IN_PROGRESS
     
-    def can_be_deleted(self) -> bool:
+    def can_be_deleted(self, now: Optional[datetime] = None) -> bool:
         """Check if contest can be deleted (only if not started)"""
-        return self.get_status() == ContestStatus.NOT_STARTED
+        return self.get_status(now) == ContestStatus.NOT_STARTED
     
     class Config:
         use_enum_values = True
 
 
+@lru_cache(maxsize=4096)
+def _parse_correct_options(correct_options: str) -> Tuple[str, ...]:
+    """Parse a correct_options JSON string once per distinct value
+
+    Contest problems are frozen copies, so the same strings are parsed on
+    every contest view and submission; the tuple keeps cached values immutable.
+    """
+    return tuple(orjson.loads(correct_options))
+
+
+@lru_cache(maxsize=4096)
+def _correct_option_set(correct_options: str) -> FrozenSet[str]:
+    """Correct options as a frozenset for order-insensitive answer matching"""
+    return frozenset(_parse_correct_options(correct_options))
+
+
 class ContestProblem(SQLModel, table=True):
     id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     contest_id: str = Field(foreign_key="contest.id")
@@ -97,5 +121,25 @@ class ContestProblem(SQLModel, table=True):
     marks: float = Field(default=1.0)
     order_index: int = Field(default=0)  # Order in the contest 
     
+    def get_correct_options(self) -> List[str]:
+        """Get correct options as a list (empty for Long Answer questions)
+
+        Raises ValueError/TypeError if the stored JSON is malformed.
+        """
+        return self.parse_correct_options(self.correct_options)
+    
+    @staticmethod
+    def parse_correct_options(correct_options: Optional[str]) -> List[str]:
+        """Correct options for a stored correct_options value, e.g. from a column-only select"""
+        if not correct_options:
+            return []
+        return list(_parse_correct_options(correct_options))
+    
+    def get_correct_option_set(self) -> FrozenSet[str]:
+        """Get correct options as a cached frozenset for scoring"""
+        if not self.correct_options:
+            return frozenset()
+        return _correct_option_set(self.correct_options)
+    
     class Config:
         use_enum_values = True 
\ No newline at end of file
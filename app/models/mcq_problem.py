@@ -7,6 +7,11 @@ from enum import Enum
 from sqlalchemy import Column, DateTime
 
 
+# Answer option labels for MCQ questions, plus a frozenset for membership tests
+MCQ_OPTION_LABELS = ("A", "B", "C", "D")
+VALID_MCQ_OPTIONS = frozenset(MCQ_OPTION_LABELS)
+
+
 class QuestionType(str, Enum):
     MCQ = "mcq"
     LONG_ANSWER = "long_answer"
@@ -2,10 +2,18 @@ from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index
 
 
 class Submission(SQLModel, table=True):
+    # Ensure one submission per student per contest; also serves the
+    # (contest_id, student_id) lookups. Existing databases get it from
+    # scripts/add_covering_indexes.py, which then drops the non-unique
+    # idx_submission_contest_student it replaces
+    __table_args__ = (
+        Index("ux_submission_contest_student", "contest_id", "student_id", unique=True),
+    )
+    
     id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     contest_id: str = Field(foreign_key="contest.id")
     student_id: str = Field(foreign_key="user.id")
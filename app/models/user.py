@@ -3,7 +3,7 @@ from typing import Optional
 from enum import Enum
 import uuid
 from datetime import datetime, timezone, date
-from sqlalchemy import Column, DateTime, Date
+from sqlalchemy import Column, DateTime, Date, func
 
 
 class UserRole(str, Enum):
@@ -71,7 +71,13 @@ class User(SQLModel, table=True):
     )
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False)
+        # Stamped by the database on every UPDATE that doesn't set it explicitly
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+            onupdate=func.now()
+        )
     )
     
     # Enhanced profile completion check
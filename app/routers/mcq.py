@@ -8,7 +8,7 @@ from app.core.database import get_session
 from app.utils.auth import get_current_admin
 from app.services.storage import storage_service
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import csv
 from io import StringIO
 
@@ -117,7 +117,7 @@ async def update_mcq(
     mcq.option_d = option_d
     mcq.correct_options = correct_options
     mcq.explanation = explanation
-    mcq.updated_at = datetime.utcnow()
+    mcq.updated_at = datetime.now(timezone.utc)
 
     session.add(mcq)
     session.commit()
@@ -208,7 +208,7 @@ async def upload_mcq_image(
     
         # Update MCQ with new image URL
         mcq.image_url = image_url
-        mcq.updated_at = datetime.utcnow()
+        mcq.updated_at = datetime.now(timezone.utc)
         
         session.add(mcq)
         session.commit()
@@ -247,7 +247,7 @@ async def remove_mcq_image(
     
     # Update MCQ to remove image URL
     mcq.image_url = None
-    mcq.updated_at = datetime.utcnow()
+    mcq.updated_at = datetime.now(timezone.utc)
     
     session.add(mcq)
     session.commit()
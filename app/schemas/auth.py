@@ -1,9 +1,20 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, validator
 from typing import Optional, List
 from app.models.user import UserRole, RegistrationStatus
 
 
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lowercase and trim an email so lookups match the lower(email) index
+
+    Blank values become None, so optional fields treat "" as "no email".
+    """
+    email = email.strip() if email else None
+    return email.lower() if email else None
+
+
 class LoginRequest(BaseModel):
+    # Kept as typed: login lowercases it for the lookup but also needs the
+    # original case to pick between case-variant accounts
     email: EmailStr
     password: str
 
@@ -32,4 +43,6 @@ class UserResponse(BaseModel):
 class CreateUserRequest(BaseModel):
     email: EmailStr
     password: str
-    role: UserRole 
\ No newline at end of file
+    role: UserRole
+    
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email) 
\ No newline at end of file
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional
 from datetime import datetime
-from app.models.mcq_problem import QuestionType, ScoringType
+from app.models.mcq_problem import QuestionType, ScoringType, MCQ_OPTION_LABELS, VALID_MCQ_OPTIONS
 
 
 class QuestionCreateBase(BaseModel):
@@ -38,10 +38,9 @@ class MCQProblemCreate(QuestionCreateBase):
     def validate_correct_options(cls, v, values):
         """Validate correct options for MCQ"""
         if values.get('question_type') == QuestionType.MCQ and v:
-            valid_options = ['A', 'B', 'C', 'D']
             for option in v:
-                if option not in valid_options:
-                    raise ValueError(f'Invalid option: {option}. Must be one of {valid_options}')
+                if option not in VALID_MCQ_OPTIONS:
+                    raise ValueError(f'Invalid option: {option}. Must be one of {list(MCQ_OPTION_LABELS)}')
         return v
     
     @validator('max_word_count')
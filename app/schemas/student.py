@@ -1,13 +1,16 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, validator
 from typing import List, Optional
 from datetime import datetime, date
 from app.models.user import UserRole, RegistrationStatus, VerificationMethod
+from app.schemas.auth import normalize_email
 
 
 class StudentCreate(BaseModel):
     email: EmailStr
     password: str
     role: UserRole = UserRole.STUDENT  # Default to student
+    
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
 
 
 class StudentResponse(BaseModel):
@@ -1,19 +1,18 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
-from app.core.database import get_session
+from sqlmodel import Session, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.database import get_session, get_async_session
 from app.core.security import verify_token
 from app.models.user import User, UserRole
-from typing import Optional
+from app.models.student_course import StudentCourse
+from typing import Optional, List, Tuple
 
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
-) -> User:
-    """Get current authenticated user"""
+def _get_user_id_from_token(credentials: HTTPAuthorizationCredentials) -> str:
+    """Validate the bearer token and return the user ID it was issued for"""
     token = credentials.credentials
     payload = verify_token(token)
     
@@ -32,7 +31,11 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = session.get(User, user_id)
+    return user_id
+
+
+def _ensure_active_user(user: Optional[User]) -> User:
+    """Reject tokens whose user no longer exists or has been deactivated"""
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,6 +52,55 @@ def get_current_user(
     return user
 
 
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: Session = Depends(get_session)
+) -> User:
+    """Get current authenticated user"""
+    user_id = _get_user_id_from_token(credentials)
+    return _ensure_active_user(session.get(User, user_id))
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_async_session)
+) -> User:
+    """Get current authenticated user for async endpoints"""
+    user_id = _get_user_id_from_token(credentials)
+    return _ensure_active_user(await session.get(User, user_id))
+
+
+async def load_user_with_courses(
+    session: AsyncSession, user_id: str
+) -> Tuple[Optional[User], List[str]]:
+    """Load a user and their active course IDs in a single round-trip"""
+    statement = (
+        select(
+            User,
+            func.array_agg(StudentCourse.course_id).filter(StudentCourse.is_active == True)
+        )
+        .outerjoin(StudentCourse, StudentCourse.student_id == User.id)
+        .where(User.id == user_id)
+        .group_by(User.id)
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        return None, []
+    
+    user, course_ids = row
+    return user, course_ids or []
+
+
+async def get_current_user_with_courses_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_async_session)
+) -> Tuple[User, List[str]]:
+    """Get current authenticated user together with their active course IDs"""
+    user_id = _get_user_id_from_token(credentials)
+    user, course_ids = await load_user_with_courses(session, user_id)
+    return _ensure_active_user(user), course_ids
+
+
 def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
     """Get current user and ensure they are an admin"""
     if current_user.role != UserRole.ADMIN:
@@ -69,6 +121,16 @@ def get_current_student(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+async def get_current_admin_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """Async-endpoint variant of get_current_admin"""
+    return get_current_admin(current_user)
+
+
+async def get_current_student_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """Async-endpoint variant of get_current_student"""
+    return get_current_student(current_user)
+
+
 def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session: Session = Depends(get_session)
@@ -5,6 +5,7 @@ Handles keyword-based scoring algorithms and manual review helpers.
 
 import json
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
@@ -120,6 +121,31 @@ def extract_keywords_from_text(text: str, keywords: List[str],
     return found_keywords, match_details
 
 
+def _keyword_lists(keywords_config) -> Tuple[List[str], List[str]]:
+    """Split a parsed keywords configuration into essential and bonus keywords"""
+    # Handle simple list format (backward compatibility)
+    if isinstance(keywords_config, list):
+        return keywords_config, []
+    essential_keywords = keywords_config.get("essential", keywords_config.get("keywords", []))
+    return essential_keywords, keywords_config.get("bonus", [])
+
+
+@lru_cache(maxsize=4096)
+def _parse_keyword_config(keywords_json: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Essential and bonus keywords for a configuration string, parsed once per distinct value
+
+    A question's configuration is the same for every answer scored against
+    it; tuples keep the cached values immutable.
+    """
+    try:
+        essential_keywords, bonus_keywords = _keyword_lists(json.loads(keywords_json))
+    except (json.JSONDecodeError, TypeError):
+        # Fallback: treat as comma-separated string
+        essential_keywords = [k.strip() for k in keywords_json.split(',') if k.strip()]
+        bonus_keywords = []
+    return tuple(essential_keywords), tuple(bonus_keywords)
+
+
 def calculate_keyword_score(student_answer: str, keywords_json: str, max_score: float,
                           essential_weight: float = 0.8, bonus_weight: float = 0.2) -> ScoringResult:
     """
@@ -138,28 +164,16 @@ def calculate_keyword_score(student_answer: str, keywords_json: str, max_score:
     if not student_answer or not keywords_json:
         return ScoringResult(0.0, max_score, [], [], {})
     
-    try:
-        # Parse keywords configuration
-        if isinstance(keywords_json, str):
-            keywords_config = json.loads(keywords_json)
-        else:
-            keywords_config = keywords_json
-            
-        # Handle simple list format (backward compatibility)
-        if isinstance(keywords_config, list):
-            keywords_config = {
-                "essential": keywords_config,
-                "bonus": []
-            }
-            
-        essential_keywords = keywords_config.get("essential", keywords_config.get("keywords", []))
-        bonus_keywords = keywords_config.get("bonus", [])
-        
-    except (json.JSONDecodeError, TypeError):
-        # Fallback: treat as comma-separated string
-        keyword_list = [k.strip() for k in str(keywords_json).split(',') if k.strip()]
-        essential_keywords = keyword_list
-        bonus_keywords = []
+    # Parse keywords configuration
+    if isinstance(keywords_json, str):
+        essential_keywords, bonus_keywords = _parse_keyword_config(keywords_json)
+    else:
+        try:
+            essential_keywords, bonus_keywords = _keyword_lists(keywords_json)
+        except TypeError:
+            # Fallback: treat as comma-separated string
+            essential_keywords = [k.strip() for k in str(keywords_json).split(',') if k.strip()]
+            bonus_keywords = []
     
     # Find keywords in student answer
     found_essential, essential_details = extract_keywords_from_text(
@@ -184,7 +198,7 @@ def calculate_keyword_score(student_answer: str, keywords_json: str, max_score:
     
     # Combine results
     all_found = found_essential + found_bonus
-    all_keywords = essential_keywords + bonus_keywords
+    all_keywords = list(essential_keywords) + list(bonus_keywords)
     missing_keywords = [k for k in all_keywords if k not in all_found]
     
     match_details = {
@@ -16,6 +16,9 @@ def to_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         # Assume naive datetime is already in UTC
         return dt.replace(tzinfo=timezone.utc)
+    elif dt.tzinfo is timezone.utc:
+        # Already UTC - identity check, no new datetime allocated
+        return dt
     else:
         # Convert timezone-aware datetime to UTC
         return dt.astimezone(timezone.utc)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Migration: forbid overlapping contests within a course
+
+Adds an exclusion constraint on contest so two contests of the same course
+can never share any part of their [start_time, end_time) window - the same
+rule create_contest and update_contest check, but enforced atomically, so
+two admins saving at once cannot both pass the check. btree_gist supplies
+the course_id equality operator for the constraint's GiST index, which the
+endpoints' tstzrange overlap probe can also use.
+
+The range is an expression in the constraint rather than a stored generated
+column, so the table is not rewritten. It is not declared on the model:
+create_all would fail on databases without the btree_gist extension.
+
+Usage:
+    python scripts/add_contest_overlap_constraint.py
+"""
+
+import os
+import sys
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from dotenv import load_dotenv
+
+CONSTRAINT_NAME = "contest_no_overlap"
+
+# Give up quickly on the table lock instead of queueing every contest read
+# behind the ALTER
+LOCK_TIMEOUT = "5s"
+
+OVERLAPPING_PAIRS_QUERY = """
+    SELECT a.course_id, a.name, b.name FROM contest a
+    JOIN contest b ON a.course_id = b.course_id AND a.id < b.id
+    WHERE a.start_time < b.end_time AND a.end_time > b.start_time
+"""
+
+
+def add_contest_overlap_constraint():
+    """Create btree_gist and the per-course no-overlap exclusion constraint"""
+    # Use DIRECT_URL for migrations if available, otherwise fallback to DATABASE_URL.
+    # Read straight from the environment (and .env) instead of importing the
+    # app settings, so the migration does not depend on the app package
+    load_dotenv()
+    database_url = os.environ.get("DIRECT_URL") or os.environ["DATABASE_URL"]
+    engine = create_engine(
+        database_url,
+        poolclass=NullPool,
+        connect_args={"options": f"-c lock_timeout={LOCK_TIMEOUT}"},
+    )
+
+    try:
+        with engine.begin() as conn:
+            exists_query = text("SELECT 1 FROM pg_constraint WHERE conname = :name")
+            if conn.execute(exists_query, {"name": CONSTRAINT_NAME}).fetchone():
+                print(f"✅ Constraint {CONSTRAINT_NAME} already exists - nothing to do")
+                return
+
+            # Existing overlaps would make the ALTER fail; list them instead
+            overlaps = conn.execute(text(OVERLAPPING_PAIRS_QUERY)).fetchall()
+            if overlaps:
+                print(f"❌ {len(overlaps)} overlapping contest pair(s) must be rescheduled first:")
+                for course_id, first_name, second_name in overlaps:
+                    print(f"   course {course_id}: '{first_name}' and '{second_name}'")
+                sys.exit(1)
+
+            print("📝 Enabling btree_gist...")
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+
+            print(f"📝 Adding {CONSTRAINT_NAME}...")
+            conn.execute(text(f"""
+                ALTER TABLE contest ADD CONSTRAINT {CONSTRAINT_NAME}
+                EXCLUDE USING gist (
+                    course_id WITH =,
+                    tstzrange(start_time, end_time, '[)') WITH &&
+                )
+            """))
+            print(f"✅ {CONSTRAINT_NAME} ready")
+    finally:
+        engine.dispose()
+
+    print("🎉 Migration complete")
+
+
+if __name__ == "__main__":
+    add_contest_overlap_constraint()
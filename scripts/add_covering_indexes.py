@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Migration: add indexes for hot read paths
+
+Each index is built with CREATE INDEX CONCURRENTLY so the table stays
+writable during the build. CONCURRENTLY cannot run inside a transaction
+block, so statements are executed on an AUTOCOMMIT connection.
+
+Usage:
+    python scripts/add_covering_indexes.py
+"""
+
+import os
+import sys
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
+from dotenv import load_dotenv
+
+HOT_PATH_INDEXES = [
+    {
+        "name": "ix_user_email_lower",
+        "table": '"user"',
+        "columns": ["lower(email)"],
+        "description": "Case-insensitive email lookups (login, profile completion)"
+    },
+    {
+        "name": "ux_submission_contest_student",
+        "table": "submission",
+        "columns": ["contest_id", "student_id"],
+        "unique": True,
+        "description": "One submission per student per contest (fails if duplicates exist)"
+    },
+]
+
+# Indexes made redundant by an entry above; dropped once it is built
+SUPERSEDED_INDEXES = [
+    "idx_submission_contest_student",  # non-unique twin of ux_submission_contest_student
+]
+
+
+def build_index_sql(index_config: dict) -> str:
+    """Build the CREATE INDEX CONCURRENTLY statement for one index definition"""
+    unique = "UNIQUE " if index_config.get("unique") else ""
+    return (
+        f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {index_config['name']} "
+        f"ON {index_config['table']} ({', '.join(index_config['columns'])})"
+    )
+
+
+def drop_if_invalid(conn, index_name: str) -> None:
+    """Drop a leftover INVALID index from an interrupted concurrent build
+
+    IF NOT EXISTS would otherwise skip it and leave an unusable index behind.
+    """
+    invalid_query = text("""
+        SELECT 1 FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :name AND NOT i.indisvalid
+    """)
+    if conn.execute(invalid_query, {"name": index_name}).fetchone():
+        print(f"🧹 Dropping invalid index {index_name} from a previous run")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+
+
+def add_covering_indexes():
+    """Create every index in HOT_PATH_INDEXES without blocking writes"""
+    # Use DIRECT_URL for migrations if available, otherwise fallback to DATABASE_URL.
+    # Read straight from the environment (and .env) instead of importing the
+    # app settings, so the migration does not depend on the app package
+    load_dotenv()
+    database_url = os.environ.get("DIRECT_URL") or os.environ["DATABASE_URL"]
+    engine = create_engine(database_url, isolation_level="AUTOCOMMIT")
+
+    failed = []
+    try:
+        with engine.connect() as conn:
+            for index_config in HOT_PATH_INDEXES:
+                print(f"📝 Creating {index_config['name']} - {index_config['description']}")
+                drop_if_invalid(conn, index_config["name"])
+                try:
+                    conn.execute(text(build_index_sql(index_config)))
+                except DBAPIError as e:
+                    # e.g. duplicate rows for a unique index; keep building the
+                    # rest and leave the INVALID index for the next run to drop
+                    print(f"❌ {index_config['name']} failed: {e.orig}")
+                    failed.append(index_config["name"])
+                    continue
+                print(f"✅ {index_config['name']} ready")
+            
+            if not failed:
+                for index_name in SUPERSEDED_INDEXES:
+                    print(f"🧹 Dropping superseded index {index_name}")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+    finally:
+        engine.dispose()
+
+    if failed:
+        print(f"⚠️  Migration finished with failures: {', '.join(failed)}")
+        sys.exit(1)
+    print("🎉 Migration complete")
+
+
+if __name__ == "__main__":
+    add_covering_indexes()
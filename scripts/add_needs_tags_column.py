@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Migration: add the needs_tags column to mcqproblem
+
+Databases created before tag tracking was introduced are missing the
+`needs_tags` column (create_all never alters existing tables). This script
+adds the column and flags every question that has no tags assigned.
+
+Usage:
+    python scripts/add_needs_tags_column.py
+"""
+
+import os
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+from dotenv import load_dotenv
+
+BACKFILL_BATCH_SIZE = 10_000
+
+# ADD COLUMN ... DEFAULT is metadata-only from PostgreSQL 11 onwards
+FAST_DEFAULT_MIN_VERSION = 110000
+
+# Give up quickly on the table lock, but allow the backfill time to run
+LOCK_TIMEOUT = "5s"
+STATEMENT_TIMEOUT = "10min"
+LOCK_NOT_AVAILABLE = "55P03"
+DDL_MAX_ATTEMPTS = 3
+DDL_RETRY_BASE_DELAY = 2
+
+# Anti-join instead of NOT IN (SELECT DISTINCT ...): no materialized
+# subquery and no NULL-aware row-by-row comparison; mcqtag's (mcq_id, tag_id)
+# primary key serves the NOT EXISTS probe. Rows already flagged are
+# skipped, so a rerun after an interrupted backfill only touches the rest
+UNTAGGED_IDS_QUERY = """
+    SELECT m.id FROM mcqproblem m
+    WHERE m.id > :last_id
+      AND m.needs_tags IS NOT TRUE
+      AND NOT EXISTS (SELECT 1 FROM mcqtag t WHERE t.mcq_id = m.id)
+    ORDER BY m.id
+    LIMIT :batch_size
+"""
+
+UNSET_IDS_QUERY = """
+    SELECT id FROM mcqproblem
+    WHERE id > :last_id AND needs_tags IS NULL
+    ORDER BY id
+    LIMIT :batch_size
+"""
+
+NEEDS_TAGS_NULLABLE_QUERY = """
+    SELECT is_nullable = 'YES'
+    FROM information_schema.columns
+    WHERE table_name = 'mcqproblem' AND column_name = 'needs_tags'
+"""
+
+
+def supports_fast_default(conn) -> bool:
+    """Whether adding a column with a constant default avoids a table rewrite"""
+    if conn.dialect.name != "postgresql":
+        return False
+    version = int(conn.execute(text("SHOW server_version_num")).scalar())
+    return version >= FAST_DEFAULT_MIN_VERSION
+
+
+def update_in_batches(engine, ids_query: str, value: bool, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Set needs_tags on the rows selected by ids_query, one transaction per batch
+
+    Bounds how long each UPDATE holds row locks and how much WAL a single
+    statement generates, instead of locking every affected row at once. The
+    keyset SELECT is inlined into the UPDATE, so each batch is one round-trip.
+    """
+    update_query = text(f"""
+        UPDATE mcqproblem SET needs_tags = :value
+        WHERE id IN ({ids_query})
+        RETURNING id
+    """)
+
+    updated_count = 0
+    last_id = ""
+    while True:
+        with engine.begin() as conn:
+            ids = conn.execute(
+                update_query, {"value": value, "last_id": last_id, "batch_size": batch_size}
+            ).scalars().all()
+        if not ids:
+            break
+        updated_count += len(ids)
+        # RETURNING order is unspecified, so resume from the largest id seen
+        last_id = max(ids)
+        print(f"   ... {updated_count} rows updated so far")
+
+    return updated_count
+
+
+def add_column(engine):
+    """Add needs_tags under a table lock in one short transaction
+
+    Does nothing if the column already exists, e.g. on a rerun after an
+    interrupted backfill.
+    """
+    with engine.begin() as conn:
+        if engine.dialect.name != "sqlite":
+            # Block concurrent writes to mcqproblem until we commit
+            conn.execute(text("LOCK TABLE mcqproblem IN SHARE MODE"))
+
+        # Check if the column already exists
+        check_query = text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = 'mcqproblem' AND column_name = 'needs_tags'
+        """)
+        if conn.execute(check_query).fetchone():
+            print("✅ Column needs_tags already exists - resuming the backfill")
+            return
+
+        print("📝 Adding needs_tags column to mcqproblem...")
+        if supports_fast_default(conn):
+            conn.execute(text(
+                "ALTER TABLE mcqproblem ADD COLUMN needs_tags BOOLEAN NOT NULL DEFAULT FALSE"
+            ))
+        else:
+            # Older servers rewrite every row for ADD COLUMN ... DEFAULT, so
+            # add it nullable and backfill; the default alone only applies
+            # to new rows and does not rewrite the table
+            conn.execute(text("ALTER TABLE mcqproblem ADD COLUMN needs_tags BOOLEAN"))
+            conn.execute(text(
+                "ALTER TABLE mcqproblem ALTER COLUMN needs_tags SET DEFAULT FALSE"
+            ))
+        print("✅ Column added")
+
+        # Approximate size from the planner statistics - a catalog lookup
+        # instead of a full COUNT(*) scan
+        estimate_query = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'mcqproblem'"
+        )
+        print(f"📊 Total MCQs (estimate): {conn.execute(estimate_query).scalar()}")
+
+
+def needs_tags_is_nullable(engine) -> bool:
+    """Whether needs_tags still has to be backfilled to FALSE and made NOT NULL
+
+    True only on the pre-11 path, until its final SET NOT NULL has run.
+    """
+    with engine.connect() as conn:
+        return bool(conn.execute(text(NEEDS_TAGS_NULLABLE_QUERY)).scalar())
+
+
+def is_lock_timeout(error: OperationalError) -> bool:
+    """Whether the statement gave up waiting for a lock (SQLSTATE 55P03)"""
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    return sqlstate == LOCK_NOT_AVAILABLE
+
+
+def add_column_with_retry(engine):
+    """Run add_column, backing off when the table lock cannot be acquired
+
+    With lock_timeout set, a busy table makes the DDL fail fast instead of
+    queueing every other query on mcqproblem behind our lock request.
+    """
+    for attempt in range(1, DDL_MAX_ATTEMPTS + 1):
+        try:
+            return add_column(engine)
+        except OperationalError as e:
+            if not is_lock_timeout(e) or attempt == DDL_MAX_ATTEMPTS:
+                raise
+            delay = DDL_RETRY_BASE_DELAY * (2 ** (attempt - 1))
+            print(f"⏳ mcqproblem is busy (attempt {attempt}/{DDL_MAX_ATTEMPTS}), retrying in {delay}s")
+            time.sleep(delay)
+
+
+def add_needs_tags_column():
+    """Add needs_tags to mcqproblem and backfill it for untagged questions"""
+    # Use DIRECT_URL for migrations if available, otherwise fallback to DATABASE_URL.
+    # Read straight from the environment (and .env) instead of importing the
+    # app settings, so the migration does not depend on the app package
+    load_dotenv()
+    database_url = os.environ.get("DIRECT_URL") or os.environ["DATABASE_URL"]
+    # One-shot script: no pool to keep warm, and every connection gets the
+    # lock/statement timeouts so a stuck ALTER cannot wedge the table
+    engine = create_engine(
+        database_url,
+        poolclass=NullPool,
+        connect_args={
+            "connect_timeout": 10,
+            "options": f"-c lock_timeout={LOCK_TIMEOUT} -c statement_timeout={STATEMENT_TIMEOUT}",
+        },
+    )
+
+    try:
+        # Short transaction for the DDL; the backfill then commits per batch.
+        # Every step below is idempotent, so a rerun resumes where an
+        # interrupted run stopped
+        add_column_with_retry(engine)
+
+        updated_count = update_in_batches(engine, UNTAGGED_IDS_QUERY, True)
+        print(f"🏷️  Flagged {updated_count} MCQs without tags")
+
+        if needs_tags_is_nullable(engine):
+            update_in_batches(engine, UNSET_IDS_QUERY, False)
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "ALTER TABLE mcqproblem ALTER COLUMN needs_tags SET NOT NULL"
+                ))
+            print("✅ needs_tags marked NOT NULL")
+    finally:
+        engine.dispose()
+
+    print("🎉 Migration complete")
+
+
+if __name__ == "__main__":
+    add_needs_tags_column()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Profile Completion Email Test Script
+
+Checks how ProfileCompletionRequest handles the optional email:
+1. An empty or blank email means "no email" and is accepted as None
+2. A provided email is trimmed and lowercased for the lower(email) lookup
+
+Usage: python -m pytest tests/test_profile_completion_email.py
+"""
+
+import os
+import sys
+
+# Add the parent directory to Python path to access app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.auth import ProfileCompletionRequest
+
+
+def test_empty_email_is_treated_as_missing():
+    """Clients send "" for "no email"; that must not be rejected"""
+    request = ProfileCompletionRequest(name="Student", email="")
+    assert request.email is None
+
+
+def test_blank_email_is_treated_as_missing():
+    request = ProfileCompletionRequest(name="Student", email="   ")
+    assert request.email is None
+
+
+def test_missing_email_stays_none():
+    request = ProfileCompletionRequest(name="Student")
+    assert request.email is None
+
+
+def test_email_is_normalized():
+    request = ProfileCompletionRequest(name="Student", email="  Student@Example.COM ")
+    assert request.email == "student@example.com"